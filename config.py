@@ -10,6 +10,13 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import json
 
+# Only advertise Brotli when urllib3 can actually decode it
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
 
 class Config:
     """Application configuration class"""
@@ -22,7 +29,13 @@ class Config:
     # Performance Settings
     CACHE_SIZE = 50
     THUMBNAIL_CACHE_SIZE = 30
+    THUMBNAIL_SIZE = (350, 200)
+    THUMBNAIL_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "streamscribe", "thumbs")
+    THUMBNAIL_DISK_CACHE_MAX = 500  # Oldest thumbnails are evicted beyond this many files
     MAX_PLAYLIST_VIDEOS = 50
+    PLAYLIST_INFO_WORKERS = 8
+    BACKGROUND_WORKERS = 8
+    GUI_IO_WORKERS = min(8, max(4, (os.cpu_count() or 2) * 2))  # Analysis and thumbnail workers
     
     # Timeout Settings
     TIMEOUT_FAST = 1.5
@@ -33,6 +46,17 @@ class Config:
     DEFAULT_QUALITY = "1080p"
     DEFAULT_FORMAT = "video"
     DEFAULT_OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Downloads")
+    CONCURRENT_FRAGMENTS = 8
+    DOWNLOAD_WORKERS = 2
+    BULK_DOWNLOAD_WORKERS = 3  # Concurrent videos during a playlist bulk download
+    DOWNLOAD_STOP_TIMEOUT = 2.0  # Seconds to wait on close for a cancelled download to stop
+    YDL_CACHE_SIZE = 4  # Option signatures (incl. output folder) with warm YoutubeDL instances
+    
+    # External downloader: opt-in, and only used when aria2c is on PATH.
+    # yt-dlp reports no live progress for external downloaders (only 'finished'),
+    # so the progress bar and speed/ETA stay idle until each file completes.
+    USE_ARIA2C = False
+    ARIA2C_ARGS = ["-x", "16", "-s", "16", "-k", "1M", "--file-allocation=none"]
     
     # Quality Mapping
     QUALITY_MAP = {
@@ -52,6 +76,9 @@ class Config:
     WINDOW_HEIGHT = 680  # Increased from 620
     MIN_WINDOW_WIDTH = 900  # Increased from 850
     MIN_WINDOW_HEIGHT = 580  # Increased from 520
+    PROGRESS_REFRESH_MS = 100  # UI progress refresh interval (10 Hz)
+    URL_CHECK_DELAY_MS = 120  # URL validation runs this long after the last keystroke
+    NOTIFICATION_TIMEOUT_MS = 15000  # Inline notification banners dismiss themselves after this
     
     # Theme Settings
     THEME_MODE = "dark"
@@ -61,6 +88,7 @@ class Config:
     LOG_LEVEL = "ERROR"
     LOG_FILE = "streamscribe.log"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    ERROR_REPEAT_LOG_INTERVAL = 300.0  # Seconds a repeated error stays suppressed before it is logged again
     
     # User Agent for requests
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -70,7 +98,7 @@ class Config:
         'User-Agent': USER_AGENT,
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
+        'Accept-Encoding': _ACCEPT_ENCODING,
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
     }
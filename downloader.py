@@ -5,21 +5,74 @@ StreamScribe Optimized Downloader Module
 Enhanced YouTube downloader with improved performance and error handling
 """
 
+import copy
 import os
+import shutil
 import threading
 import re
 import json
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Callable, Optional, Dict, Any, List
 from pathlib import Path
 import requests
 from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadCancelled
 
 from config import config
 from logger import get_logger
+from utils import DaemonThreadPoolExecutor
 
 logger = get_logger('downloader')
 
+# Page scraping patterns work on raw response bytes - every token is ASCII
+_PLAYER_RESPONSE_RE = re.compile(rb'var ytInitialPlayerResponse = (\{.*?\});')
+_INITIAL_DATA_RE = re.compile(rb'var ytInitialData = (\{.*?\});')
+_VIDEO_ID_IN_HTML_RE = re.compile(rb'"videoId":"([a-zA-Z0-9_-]{11})"')
+_PLAYLIST_ITEM_VIDEO_ID_RE = re.compile(rb'"playlistItemRenderer".*?"videoId":"([a-zA-Z0-9_-]{11})"')
+_VIDEO_TITLE_FALLBACK_RES = (
+    re.compile(rb'"title":"([^"]+)"'),
+    re.compile(rb'"title":\{"runs":\[\{"text":"([^"]+)"'),
+    re.compile(rb'<title>([^<]+)</title>'),
+)
+_PLAYLIST_TITLE_FALLBACK_RES = (
+    re.compile(rb'"playlistTitle":"([^"]+)"'),
+    re.compile(rb'"title":"([^"]+)".*"playlistRenderer"'),
+    re.compile(rb'<title>([^<]+)</title>'),
+)
+
+
+def _decode_match(match: 're.Match') -> str:
+    """Decode only the captured slice of a bytes match"""
+    return match.group(1).decode('utf-8', 'replace')
+
+
+def _freeze_options(value: Any) -> Any:
+    """Turn a yt-dlp options structure into a hashable cache key"""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze_options(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_options(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze_options(item) for item in value)
+    return value
+
+
+# YouTube serves thumbnails at predictable URLs, so no HEAD probe is needed
+_THUMBNAIL_URL = 'https://img.youtube.com/vi/{video_id}/{variant}.jpg'
+
+
+def _thumbnail_urls(video_id: str) -> Dict[str, str]:
+    """Predict primary and fallback thumbnail URLs for a video ID"""
+    return {
+        'thumbnail': _THUMBNAIL_URL.format(video_id=video_id, variant='maxresdefault'),
+        'fallback_thumbnail': _THUMBNAIL_URL.format(video_id=video_id, variant='mqdefault'),
+    }
+
 
 class OptimizedYouTubeDownloader:
     """Optimized YouTube video/playlist downloader class"""
@@ -29,13 +82,37 @@ class OptimizedYouTubeDownloader:
         self.progress_callback: Optional[Callable] = None
         self.status_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = None
-        self._is_downloading = False
-        self._download_thread: Optional[threading.Thread] = None
+        
+        # In-flight downloads, deduplicated per URL
+        self._active_urls: set = set()
+        self._active_lock = threading.Lock()
+        self._stable_total_bytes: Dict[str, int] = {}
+        # Per-call (progress, status) callbacks by URL, for downloads that report on their own
+        self._call_callbacks: Dict[str, tuple] = {}
+        # Set by cancel(); running downloads stop at their next progress tick
+        self._cancel_event = threading.Event()
+        
+        # Bounded pool so repeated download requests cannot pile up threads
+        self._download_pool = DaemonThreadPoolExecutor(
+            max_workers=config.DOWNLOAD_WORKERS,
+            thread_name_prefix='dl'
+        )
         
         # Performance optimizations
         self._session = requests.Session()
         self._session.headers.update(config.REQUEST_HEADERS)
         
+        # Shared pool for I/O-bound metadata fan-out (threads start lazily)
+        self._executor = DaemonThreadPoolExecutor(
+            max_workers=config.PLAYLIST_INFO_WORKERS,
+            thread_name_prefix='info'
+        )
+        
+        # Idle warm YoutubeDL instances per options signature, least recently used first
+        self._ydl_instances: "OrderedDict[frozenset, list]" = OrderedDict()
+        self._ydl_instances_lock = threading.Lock()
+        self._ydl_closed = False
+        
         # Cache for video info
         self._video_info_cache: Dict[str, Dict[str, Any]] = {}
         self._thumbnail_cache: Dict[str, bytes] = {}
@@ -43,6 +120,9 @@ class OptimizedYouTubeDownloader:
         # Set FFmpeg path
         self.ffmpeg_path = config.get_ffmpeg_path()
         
+        # Multi-connection external downloader, if enabled and installed
+        self.aria2c_path = shutil.which('aria2c') if config.USE_ARIA2C else None
+        
         # Ensure output directory exists
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
         
@@ -60,10 +140,69 @@ class OptimizedYouTubeDownloader:
         """Set callback function for error handling"""
         self.error_callback = callback
     
+    def cancel(self):
+        """Stop running downloads at their next progress tick and refuse new ones"""
+        self._cancel_event.set()
+    
+    @contextmanager
+    def _ydl(self, ydl_opts: Dict[str, Any]):
+        """Yield an idle cached YoutubeDL for these options, skipping extractor init on reuse
+        
+        Each thread gets its own instance; up to BULK_DOWNLOAD_WORKERS are kept
+        per options signature for the next callers.
+        """
+        key = _freeze_options(ydl_opts)
+        ydl = None
+        with self._ydl_instances_lock:
+            idle = self._ydl_instances.get(key)
+            if idle:
+                ydl = idle.pop()
+        
+        if ydl is None:
+            # YoutubeDL fills defaults into its params, so give it a copy
+            ydl = YoutubeDL(dict(ydl_opts))
+        try:
+            yield ydl
+        finally:
+            self._release_ydl(key, ydl)
+    
+    def _release_ydl(self, key: frozenset, ydl: YoutubeDL):
+        """Return an instance to its pool, closing whatever no longer fits the cache"""
+        to_close = []
+        with self._ydl_instances_lock:
+            idle = self._ydl_instances.get(key)
+            if idle is None and not self._ydl_closed:
+                idle = self._ydl_instances[key] = []
+                # Output folders are part of the signature; keep only the recent ones
+                while len(self._ydl_instances) > config.YDL_CACHE_SIZE:
+                    _, evicted = self._ydl_instances.popitem(last=False)
+                    to_close.extend(evicted)
+            
+            if idle is not None and len(idle) < config.BULK_DOWNLOAD_WORKERS:
+                idle.append(ydl)
+                self._ydl_instances.move_to_end(key)
+            else:
+                to_close.append(ydl)
+        
+        for instance in to_close:
+            try:
+                instance.close()
+            except Exception as e:
+                logger.debug("YoutubeDL close error: %s", e)
+    
     def _progress_hook(self, d: Dict[str, Any]):
         """Optimized progress hook for yt-dlp with stable size handling"""
+        if self._cancel_event.is_set():
+            # yt-dlp lets hook exceptions abort the running download
+            raise DownloadCancelled()
+        
         try:
-            if not self.progress_callback:
+            # yt-dlp records the URL given to download() as original_url
+            info = d.get('info_dict') or {}
+            progress_callback, status_callback = self._call_callbacks.get(
+                info.get('original_url'), (self.progress_callback, self.status_callback)
+            )
+            if not progress_callback:
                 return
             
             status = d.get('status', '')
@@ -74,19 +213,20 @@ class OptimizedYouTubeDownloader:
                 total_bytes = d.get('total_bytes', 0)
                 total_bytes_estimate = d.get('total_bytes_estimate', 0)
                 
-                # Stabilize total size - use the largest stable value
-                if not hasattr(self, '_stable_total_bytes'):
-                    self._stable_total_bytes = 0
+                # Stabilize total size per file - downloads may run concurrently
+                file_key = d.get('filename', '')
+                stable_total = self._stable_total_bytes.get(file_key, 0)
                 
                 # Update stable total bytes only if we get a larger, more reliable value
-                current_total = max(total_bytes, total_bytes_estimate)
-                if current_total > self._stable_total_bytes and current_total > 0:
+                current_total = max(total_bytes or 0, total_bytes_estimate or 0)
+                if current_total > stable_total and current_total > 0:
                     # Only update if the new value is significantly larger (prevents small fluctuations)
-                    if current_total > self._stable_total_bytes * 1.1 or self._stable_total_bytes == 0:
-                        self._stable_total_bytes = current_total
+                    if current_total > stable_total * 1.1 or stable_total == 0:
+                        stable_total = current_total
+                        self._stable_total_bytes[file_key] = stable_total
                 
                 # Use stable total bytes for progress calculation
-                final_total = self._stable_total_bytes if self._stable_total_bytes > 0 else current_total
+                final_total = stable_total if stable_total > 0 else current_total
                 
                 # Calculate stable percentage
                 if final_total > 0:
@@ -107,19 +247,18 @@ class OptimizedYouTubeDownloader:
                 }
                 
                 # Log progress data for debugging
-                logger.debug(f"Progress data: {progress_data}")
+                logger.debug("Progress data: %s", progress_data)
                 
-                self.progress_callback(progress_data)
+                progress_callback(progress_data)
                 
             elif status == 'finished':
-                if self.status_callback:
-                    self.status_callback("İşleniyor...")
+                if status_callback:
+                    status_callback("İşleniyor...")
                 
-                # Reset stable total bytes for next download
-                if hasattr(self, '_stable_total_bytes'):
-                    self._stable_total_bytes = 0
+                # Forget the stable total for the finished file
+                self._stable_total_bytes.pop(d.get('filename', ''), None)
                 
-                self.progress_callback({
+                progress_callback({
                     'status': 'finished',
                     'percent': '100%',
                     '_percent_str': '100%',
@@ -131,14 +270,15 @@ class OptimizedYouTubeDownloader:
                 # Log format selection and quality information
                 info_msg = d.get('message', '')
                 if 'format' in info_msg.lower() or 'resolution' in info_msg.lower():
-                    print(f"🎬 Format Seçimi: {info_msg}")
+                    logger.debug("Format Seçimi: %s", info_msg)
                 elif 'downloading' in info_msg.lower():
-                    print(f"📥 İndiriliyor: {info_msg}")
+                    logger.debug("İndiriliyor: %s", info_msg)
                 
         except Exception as e:
             logger.error(f"Progress hook error: {e}")
     
-    def _build_format_string(self, max_height: int, prefer_mp4: bool) -> str:
+    @staticmethod
+    def _build_format_string(max_height: int, prefer_mp4: bool) -> str:
         """Build flexible format string for video quality with audio"""
         try:
             # More flexible approach to avoid 403 errors
@@ -149,115 +289,136 @@ class OptimizedYouTubeDownloader:
                 # Flexible format selection with fallbacks
                 format_string = f"bestvideo[height<={max_height}]+bestaudio/bestvideo[height<={max_height}]+bestaudio/best[height<={max_height}]+bestaudio/best+bestaudio"
             
-            print(f"🔍 Oluşturulan Format String: {format_string}")
+            logger.debug("Oluşturulan Format String: %s", format_string)
             return format_string
             
         except Exception as e:
             logger.error(f"Format string building error: {e}")
             # Fallback to best format that includes audio - CRITICAL FOR AUDIO
             fallback = f"best[height<={max_height}]+bestaudio/best+bestaudio"
-            print(f"⚠️ Fallback Format String: {fallback}")
+            logger.debug("Fallback Format String: %s", fallback)
             return fallback
     
     def _get_optimized_ydl_options(self, audio_only: bool, max_height: int, 
                                  prefer_mp4: bool, no_playlist: bool, 
                                  include_subs: bool, sub_langs: str, 
-                                 auto_subs: bool) -> Dict[str, Any]:
-        """Get optimized yt-dlp options"""
+                                 auto_subs: bool, output_dir: Optional[str] = None) -> Dict[str, Any]:
+        """Get optimized yt-dlp options, saving into output_dir (default: self.output_dir)"""
         try:
-            options = {
-                "outtmpl": os.path.join(self.output_dir, "%(title).200s [%(id)s].%(ext)s"),
+            template = self._build_ydl_template(
+                audio_only, max_height, prefer_mp4, no_playlist,
+                include_subs, sub_langs, auto_subs,
+                self.ffmpeg_path, self.aria2c_path
+            )
+            # The template is shared across calls; yt-dlp may mutate nested option values
+            return {
+                **copy.deepcopy(dict(template)),
+                "outtmpl": os.path.join(output_dir or self.output_dir, "%(title).200s [%(id)s].%(ext)s"),
                 "progress_hooks": [self._progress_hook],
-                "noplaylist": no_playlist,
-                "quiet": False,
-                "no_warnings": False,
-                "concurrent_fragment_downloads": 4,
-                "retries": 10,
-                "ffmpeg_location": self.ffmpeg_path,
-                "socket_timeout": config.TIMEOUT_LONG,
-                "fragment_retries": 3,
-                "extractor_retries": 3,
-                "http_chunk_size": 10485760,  # 10MB chunks
-                # Size stabilization options
-                "buffersize": 1024,  # Smaller buffer for more stable progress
-                "sleep_interval": 0.1,  # Faster progress updates
-                "merge_output_format": "mp4" if prefer_mp4 else "mkv",
-                # Quality optimization settings - flexible approach
-                "format_sort": ["res", "fps", "codec:h264", "codec:vp9", "codec:av1"],
-                "format_sort_force": False,  # More flexible sorting
-                "prefer_free_formats": True,  # Prefer free formats to avoid 403
-                "check_formats": False,  # Disable format checking to avoid 403
             }
             
-            if audio_only:
-                options.update({
-                    "format": "bestaudio/best",
-                    "postprocessors": [
-                        {
-                            "key": "FFmpegExtractAudio", 
-                            "preferredcodec": "mp3", 
-                            "preferredquality": "192"
-                        },
-                        {"key": "FFmpegMetadata"},
-                    ],
-                })
-            else:
-                # For video downloads, use enhanced format string with audio guarantee
-                format_string = self._build_format_string(max_height, prefer_mp4)
-                pass
-                
-                # Add fallback format to ensure audio is always included
-                fallback_format = f"best[height<={max_height}]+bestaudio/best+bestaudio"
-                pass
-                
-                # Use the generated format string
-                options["format"] = format_string
-                # For video downloads, ensure audio is preserved and merged properly
-                options.setdefault("postprocessors", []).extend([
-                    # Use FFmpegVideoConvertor to ensure video+audio merge
-                    {"key": "FFmpegVideoConvertor", "preferedformat": "mp4" if prefer_mp4 else "mkv"},
-                    {"key": "FFmpegMetadata"}
-                ])
-                # Critical audio preservation settings
-                options["keepvideo"] = False  # Don't keep separate video file
-                options["keepaudio"] = False  # Don't keep separate audio file
-                options["audioformat"] = "best"  # Best audio quality
-                options["audioquality"] = "0"  # Best audio quality (0 = best)
-                options["extractaudio"] = False  # Don't extract audio separately
-                options["prefer_ffmpeg"] = True  # Prefer FFmpeg for processing
-                # Force audio stream inclusion
-                options["audio_multistreams"] = True  # Allow multiple audio streams
-                options["audio_preference"] = "best"  # Prefer best audio
-                # Additional audio preservation for single video downloads
-                options["audio_only"] = False  # Ensure we're downloading video+audio
-                options["extract_flat"] = False  # Don't extract flat (keeps audio)
-                options["ignore_no_formats_error"] = True  # Ignore format errors
-                # Ensure video+audio merge
-                options["merge_output_format"] = "mp4" if prefer_mp4 else "mkv"
-                options["prefer_ffmpeg"] = True  # Prefer FFmpeg for processing
-                # Quality enforcement - force higher quality
-                options["format_sort"] = ["res", "fps", "codec:h264", "codec:vp9", "codec:av1"]
-                options["format_sort_force"] = True  # Force strict sorting
-                options["prefer_free_formats"] = False  # Don't prefer free formats
-                options["check_formats"] = True  # Enable format checking
-                options["format_sort_force"] = True  # Force quality selection
-            
-            if include_subs:
-                langs = [s.strip() for s in sub_langs.split(",") if s.strip()]
-                options.update({
-                    "writesubtitles": True,
-                    "writeautomaticsub": auto_subs,
-                    "subtitleslangs": langs,
-                    "subtitlesformat": "srt",
-                    "embedsubtitles": True,
-                })
-            
-            return options
-            
         except Exception as e:
             logger.error(f"Options building error: {e}")
             return {"format": "best"}
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _build_ydl_template(audio_only: bool, max_height: int,
+                            prefer_mp4: bool, no_playlist: bool,
+                            include_subs: bool, sub_langs: str,
+                            auto_subs: bool, ffmpeg_path: Optional[str],
+                            aria2c_path: Optional[str]) -> MappingProxyType:
+        """Build the per-instance-independent yt-dlp options once per flag combination
+        
+        The result is shared between calls; _get_optimized_ydl_options deep-copies it.
+        """
+        options = {
+            "noplaylist": no_playlist,
+            "quiet": False,
+            "no_warnings": False,
+            "concurrent_fragment_downloads": config.CONCURRENT_FRAGMENTS,
+            "retries": 10,
+            "ffmpeg_location": ffmpeg_path,
+            "socket_timeout": config.TIMEOUT_LONG,
+            "fragment_retries": 3,
+            "extractor_retries": 3,
+            "http_chunk_size": 10485760,  # 10MB chunks
+            # Size stabilization options
+            "buffersize": 1024,  # Smaller buffer for more stable progress
+            "sleep_interval": 0.1,  # Faster progress updates
+            "merge_output_format": "mp4" if prefer_mp4 else "mkv",
+            # Quality optimization settings - flexible approach
+            "format_sort": ["res", "fps", "codec:h264", "codec:vp9", "codec:av1"],
+            "format_sort_force": False,  # More flexible sorting
+            "prefer_free_formats": True,  # Prefer free formats to avoid 403
+            "check_formats": False,  # Disable format checking to avoid 403
+        }
+        
+        if aria2c_path:
+            # Several connections per file/fragment beat YouTube's per-connection throttling
+            options["external_downloader"] = {"default": aria2c_path}
+            options["external_downloader_args"] = {"aria2c": list(config.ARIA2C_ARGS)}
+        
+        if audio_only:
+            options.update({
+                "format": "bestaudio/best",
+                "postprocessors": [
+                    {
+                        "key": "FFmpegExtractAudio", 
+                        "preferredcodec": "mp3", 
+                        "preferredquality": "192"
+                    },
+                    {"key": "FFmpegMetadata"},
+                ],
+            })
+        else:
+            # For video downloads, use enhanced format string with audio guarantee
+            format_string = OptimizedYouTubeDownloader._build_format_string(max_height, prefer_mp4)
+            
+            # Use the generated format string
+            options["format"] = format_string
+            # For video downloads, ensure audio is preserved and merged properly
+            options.setdefault("postprocessors", []).extend([
+                # Use FFmpegVideoConvertor to ensure video+audio merge
+                {"key": "FFmpegVideoConvertor", "preferedformat": "mp4" if prefer_mp4 else "mkv"},
+                {"key": "FFmpegMetadata"}
+            ])
+            # Critical audio preservation settings
+            options["keepvideo"] = False  # Don't keep separate video file
+            options["keepaudio"] = False  # Don't keep separate audio file
+            options["audioformat"] = "best"  # Best audio quality
+            options["audioquality"] = "0"  # Best audio quality (0 = best)
+            options["extractaudio"] = False  # Don't extract audio separately
+            options["prefer_ffmpeg"] = True  # Prefer FFmpeg for processing
+            # Force audio stream inclusion
+            options["audio_multistreams"] = True  # Allow multiple audio streams
+            options["audio_preference"] = "best"  # Prefer best audio
+            # Additional audio preservation for single video downloads
+            options["audio_only"] = False  # Ensure we're downloading video+audio
+            options["extract_flat"] = False  # Don't extract flat (keeps audio)
+            options["ignore_no_formats_error"] = True  # Ignore format errors
+            # Ensure video+audio merge
+            options["merge_output_format"] = "mp4" if prefer_mp4 else "mkv"
+            options["prefer_ffmpeg"] = True  # Prefer FFmpeg for processing
+            # Quality enforcement - force higher quality
+            options["format_sort"] = ["res", "fps", "codec:h264", "codec:vp9", "codec:av1"]
+            options["format_sort_force"] = True  # Force strict sorting
+            options["prefer_free_formats"] = False  # Don't prefer free formats
+            options["check_formats"] = True  # Enable format checking
+            options["format_sort_force"] = True  # Force quality selection
+        
+        if include_subs:
+            langs = [s.strip() for s in sub_langs.split(",") if s.strip()]
+            options.update({
+                "writesubtitles": True,
+                "writeautomaticsub": auto_subs,
+                "subtitleslangs": langs,
+                "subtitlesformat": "srt",
+                "embedsubtitles": True,
+            })
+        
+        return MappingProxyType(options)
+    
     def download(self, url: str, 
                  audio_only: bool = False,
                  max_height: int = 1080,
@@ -265,41 +426,62 @@ class OptimizedYouTubeDownloader:
                  no_playlist: bool = False,
                  include_subs: bool = False,
                  sub_langs: str = "tr,en",
-                 auto_subs: bool = False) -> bool:
-        """Download video/playlist with optimized options"""
+                 auto_subs: bool = False,
+                 output_dir: Optional[str] = None,
+                 progress_callback: Optional[Callable] = None,
+                 status_callback: Optional[Callable] = None) -> bool:
+        """Download video/playlist with optimized options
+        
+        output_dir overrides self.output_dir for this call only, so concurrent
+        downloads can target different folders without touching shared state.
+        progress_callback/status_callback likewise replace the shared callbacks
+        for this call, so concurrent downloads can report separately.
+        """
+        if self._cancel_event.is_set():
+            return False
+        
+        progress_callback = progress_callback or self.progress_callback
+        status_callback = status_callback or self.status_callback
         
-        if self._is_downloading:
-            error_msg = "Zaten bir indirme işlemi devam ediyor!"
+        with self._active_lock:
+            already_active = url in self._active_urls
+            if not already_active:
+                self._active_urls.add(url)
+                self._call_callbacks[url] = (progress_callback, status_callback)
+        
+        if already_active:
+            error_msg = "Bu video zaten indiriliyor!"
             logger.warning(error_msg)
             if self.error_callback:
                 self.error_callback(error_msg)
             return False
         
         try:
-            self._is_downloading = True
-            if self.status_callback:
-                self.status_callback("İndirme başlatılıyor...")
+            if status_callback:
+                status_callback("İndirme başlatılıyor...")
             
             # Get optimized options
             ydl_opts = self._get_optimized_ydl_options(
                 audio_only, max_height, prefer_mp4, no_playlist, 
-                include_subs, sub_langs, auto_subs
+                include_subs, sub_langs, auto_subs, output_dir
             )
             
-            # Print quality selection info
-            print(f"🎯 Seçilen Kalite: {max_height}p")
-            print(f"📹 Format String: {ydl_opts.get('format', 'N/A')}")
-            print(f"🔧 Format Sort: {ydl_opts.get('format_sort', 'N/A')}")
+            # Log quality selection info
+            logger.debug("Seçilen Kalite: %sp, format: %s, sort: %s",
+                         max_height, ydl_opts.get('format', 'N/A'), ydl_opts.get('format_sort', 'N/A'))
             
             # Start download
-            with YoutubeDL(ydl_opts) as ydl:
+            with self._ydl(ydl_opts) as ydl:
                 ydl.download([url])
             
-            if self.status_callback:
-                self.status_callback("İndirme tamamlandı!")
+            if status_callback:
+                status_callback("İndirme tamamlandı!")
             
             return True
             
+        except DownloadCancelled:
+            logger.info(f"Download cancelled: {url}")
+            return False
         except Exception as e:
             error_str = str(e)
             logger.error(f"Download error: {e}")
@@ -324,27 +506,17 @@ class OptimizedYouTubeDownloader:
                 self.error_callback(error_msg)
             return False
         finally:
-            self._is_downloading = False
+            with self._active_lock:
+                self._active_urls.discard(url)
+                self._call_callbacks.pop(url, None)
     
-    def download_async(self, *args, **kwargs) -> threading.Thread:
-        """Start download in a separate thread with proper cleanup"""
-        if self._download_thread and self._download_thread.is_alive():
-            pass
-            return self._download_thread
-        
-        self._download_thread = threading.Thread(
-            target=self.download, 
-            args=args, 
-            kwargs=kwargs,
-            daemon=True,
-            name="DownloadThread"
-        )
-        self._download_thread.start()
-        return self._download_thread
+    def download_async(self, *args, **kwargs) -> Future:
+        """Queue download on the bounded download pool and return its Future"""
+        return self._download_pool.submit(self.download, *args, **kwargs)
     
     def is_downloading(self) -> bool:
-        """Check if download is in progress"""
-        return self._is_downloading
+        """Check if any download is in progress"""
+        return bool(self._active_urls)
     
     def _extract_video_id(self, url: str) -> str:
         """Extract YouTube video ID from URL with optimized patterns"""
@@ -378,6 +550,10 @@ class OptimizedYouTubeDownloader:
         if not title:
             return 'Bilinmeyen Video'
         
+        # Fast path: plain ASCII with no entities or escapes only needs whitespace cleanup
+        if title.isascii() and '&' not in title and '\\' not in title and '<' not in title:
+            return ' '.join(title.split()) or 'Bilinmeyen Video'
+        
         try:
             import html
             import unicodedata
@@ -415,12 +591,11 @@ class OptimizedYouTubeDownloader:
             logger.error(f"Error in get_video_info_fast: {e}")
             return {'error': 'Video bilgisi alınamadı. Lütfen URL\'yi kontrol edin.'}
     
-    def _extract_title_from_html_optimized(self, html: str) -> str:
-        """Extract video title using optimized JSON parsing"""
+    def _extract_title_from_html_optimized(self, html: bytes) -> str:
+        """Extract video title from raw page bytes using optimized JSON parsing"""
         try:
             # Method 1: ytInitialPlayerResponse JSON
-            json_pattern = r'var ytInitialPlayerResponse = (\{.*?\});'
-            json_match = re.search(json_pattern, html)
+            json_match = _PLAYER_RESPONSE_RE.search(html)
             if json_match:
                 try:
                     json_data = json.loads(json_match.group(1))
@@ -431,8 +606,7 @@ class OptimizedYouTubeDownloader:
                     pass
             
             # Method 2: ytInitialData JSON
-            json_pattern2 = r'var ytInitialData = (\{.*?\});'
-            json_match2 = re.search(json_pattern2, html)
+            json_match2 = _INITIAL_DATA_RE.search(html)
             if json_match2:
                 try:
                     json_data = json.loads(json_match2.group(1))
@@ -449,23 +623,17 @@ class OptimizedYouTubeDownloader:
                     pass
             
             # Method 3: Simple regex fallback
-            patterns = [
-                r'"title":"([^"]+)"',
-                r'"title":\{"runs":\[\{"text":"([^"]+)"',
-                r'<title>([^<]+)</title>'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, html)
+            for pattern in _VIDEO_TITLE_FALLBACK_RES:
+                match = pattern.search(html)
                 if match:
-                    title = match.group(1)
+                    title = _decode_match(match)
                     if title and title != 'YouTube':
                         return title.replace(' - YouTube', '').strip()
             
             return 'Bilinmeyen Video'
             
         except Exception as e:
-            pass
+            logger.debug("Parsing error in _extract_title_from_html_optimized: %s", e)
             return 'Bilinmeyen Video'
     
     def _get_playlist_info_optimized(self, url: str) -> Dict[str, Any]:
@@ -480,7 +648,9 @@ class OptimizedYouTubeDownloader:
             if response.status_code != 200:
                 return {'error': 'Playlist sayfası erişilemez'}
             
-            html = response.text
+            # All searched tokens are ASCII, so scan the raw bytes and only
+            # decode the matched slices instead of the whole page
+            html = response.content
             
             # Extract playlist title
             title = self._extract_playlist_title_optimized(html)
@@ -491,16 +661,13 @@ class OptimizedYouTubeDownloader:
             video_count = self._count_playlist_videos_optimized(html)
             
             # Get thumbnail
-            thumbnail_url = ''
-            first_video_id = self._extract_first_video_id(html)
-            if first_video_id:
-                thumbnail_url = f'https://img.youtube.com/vi/{first_video_id}/mqdefault.jpg'
-            else:
-                thumbnail_url = 'https://img.youtube.com/vi/dQw4w9WgXcQ/mqdefault.jpg'
+            first_video_id = self._extract_first_video_id(html) or 'dQw4w9WgXcQ'
+            thumbnails = _thumbnail_urls(first_video_id)
             
             result = {
                 'title': f"{self._clean_title(title)} ({video_count} video)",
-                'thumbnail': thumbnail_url,
+                'thumbnail': thumbnails['fallback_thumbnail'],
+                'fallback_thumbnail': thumbnails['fallback_thumbnail'],
                 'is_playlist': True,
                 'playlist_count': video_count,
                 'playlist_id': playlist_id,
@@ -520,12 +687,11 @@ class OptimizedYouTubeDownloader:
             logger.error(f"Error in playlist info: {e}")
             return {'error': f'Playlist bilgisi alınamadı: {str(e)[:30]}...'}
     
-    def _extract_playlist_title_optimized(self, html: str) -> str:
-        """Extract playlist title using optimized JSON parsing"""
+    def _extract_playlist_title_optimized(self, html: bytes) -> str:
+        """Extract playlist title from raw page bytes using optimized JSON parsing"""
         try:
             # Try ytInitialData JSON
-            json_pattern = r'var ytInitialData = (\{.*?\});'
-            json_match = re.search(json_pattern, html)
+            json_match = _INITIAL_DATA_RE.search(html)
             if json_match:
                 try:
                     json_data = json.loads(json_match.group(1))
@@ -548,17 +714,11 @@ class OptimizedYouTubeDownloader:
                     pass
             
             # Fallback patterns
-            patterns = [
-                r'"playlistTitle":"([^"]+)"',
-                r'"title":"([^"]+)".*"playlistRenderer"',
-                r'<title>([^<]+)</title>',
-            ]
-            
-            for pattern in patterns:
+            for pattern in _PLAYLIST_TITLE_FALLBACK_RES:
                 try:
-                    match = re.search(pattern, html)
+                    match = pattern.search(html)
                     if match:
-                        title = match.group(1)
+                        title = _decode_match(match)
                         if title and 'YouTube' not in title and len(title) > 3:
                             clean_title = title.replace(' - YouTube', '').replace(' | YouTube', '').strip()
                             if clean_title:
@@ -569,45 +729,45 @@ class OptimizedYouTubeDownloader:
             return ''
             
         except Exception as e:
-            pass
+            logger.debug("Parsing error in _extract_playlist_title_optimized: %s", e)
             return ''
     
-    def _count_playlist_videos_optimized(self, html: str) -> int:
+    def _count_playlist_videos_optimized(self, html: bytes) -> int:
         """Count videos in playlist using optimized method"""
         try:
             # Count videoId patterns
-            video_matches = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', html)
+            video_matches = _VIDEO_ID_IN_HTML_RE.findall(html)
             unique_videos = len(set(video_matches))
             
             if unique_videos > 0:
                 return min(unique_videos, config.MAX_PLAYLIST_VIDEOS)
             
             # Count playlist items
-            item_matches = re.findall(r'"playlistItemRenderer"', html)
-            if item_matches:
-                return min(len(item_matches), config.MAX_PLAYLIST_VIDEOS)
+            item_count = html.count(b'"playlistItemRenderer"')
+            if item_count:
+                return min(item_count, config.MAX_PLAYLIST_VIDEOS)
             
             return 0
             
         except Exception as e:
-            pass
+            logger.debug("Parsing error in _count_playlist_videos_optimized: %s", e)
             return 0
     
-    def _extract_first_video_id(self, html: str) -> str:
+    def _extract_first_video_id(self, html: bytes) -> str:
         """Extract first video ID from playlist for thumbnail"""
         try:
-            video_matches = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', html)
-            if video_matches:
-                return video_matches[0]
+            match = _VIDEO_ID_IN_HTML_RE.search(html)
+            if match:
+                return _decode_match(match)
             
-            item_pattern = r'"playlistItemRenderer".*?"videoId":"([a-zA-Z0-9_-]{11})"'
-            item_match = re.search(item_pattern, html)
+            item_match = _PLAYLIST_ITEM_VIDEO_ID_RE.search(html)
             if item_match:
-                return item_match.group(1)
+                return _decode_match(item_match)
             
             return ''
             
-        except Exception:
+        except Exception as e:
+            logger.debug("Parsing error in _extract_first_video_id: %s", e)
             return ''
     
     def get_video_info(self, url: str) -> Dict[str, Any]:
@@ -630,7 +790,9 @@ class OptimizedYouTubeDownloader:
                 'no_warnings': True,
                 'skip_download': True,
                 'no_check_certificate': True,
-                'extract_flat': False,
+                # Playlists only need id/title per entry - skip per-video watch pages
+                'extract_flat': 'in_playlist',
+                'lazy_playlist': True,
                 'ignoreerrors': True,
                 'socket_timeout': config.TIMEOUT_LONG,
                 'retries': 2,
@@ -645,32 +807,44 @@ class OptimizedYouTubeDownloader:
                 'format': 'worst',
             }
             
-            with YoutubeDL(ydl_opts) as ydl:
+            with self._ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 
                 if not info:
                     return {'error': 'Video bilgisi alınamadı'}
                 
                 # Check if it's a playlist
-                is_playlist = 'entries' in info and info['entries']
+                entries = list(info.get('entries') or [])
                 
-                if is_playlist:
-                    first_entry = info['entries'][0] if info['entries'] else {}
-                    playlist_count = len(info['entries'])
-                    return {
+                if entries:
+                    first_entry = entries[0] or {}
+                    playlist_count = info.get('playlist_count') or len(entries)
+                    result = {
                         'title': f"{info.get('title', 'Playlist')} ({playlist_count} video)",
-                        'thumbnail': first_entry.get('thumbnail', ''),
+                        'thumbnail': '',
                         'is_playlist': True,
                         'playlist_count': playlist_count,
                         'method': 'yt-dlp'
                     }
+                    if first_entry.get('id'):
+                        # Flat entries carry no thumbnail; mqdefault always exists
+                        result['thumbnail'] = _thumbnail_urls(first_entry['id'])['fallback_thumbnail']
+                    return result
                 else:
-                    return {
+                    video_id = info.get('id', '')
+                    result = {
                         'title': info.get('title', 'Bilinmiyor'),
                         'thumbnail': info.get('thumbnail', ''),
+                        'video_id': video_id,
                         'is_playlist': False,
                         'method': 'yt-dlp'
                     }
+                    if video_id:
+                        # Optimistically predict maxres; the UI retries with mqdefault on failure
+                        thumbnails = _thumbnail_urls(video_id)
+                        result['thumbnail'] = result['thumbnail'] or thumbnails['thumbnail']
+                        result['fallback_thumbnail'] = thumbnails['fallback_thumbnail']
+                    return result
                     
         except Exception as e:
             error_msg = str(e)
@@ -683,8 +857,12 @@ class OptimizedYouTubeDownloader:
             else:
                 return {'error': f'Hata: {error_msg[:50]}...'}
     
-    def get_playlist_entries(self, url: str) -> List[Dict[str, Any]]:
-        """Get detailed playlist entries for selection"""
+    def get_playlist_entries(self, url: str, max_workers: int = None) -> List[Dict[str, Any]]:
+        """Get detailed playlist entries for selection
+        
+        Entries whose flat metadata lacks a title are resolved concurrently
+        with get_video_info_fast, bounded by max_workers.
+        """
         try:
             ydl_opts = {
                 'quiet': True,
@@ -697,23 +875,29 @@ class OptimizedYouTubeDownloader:
                 'no_call_home': True,
             }
             
-            with YoutubeDL(ydl_opts) as ydl:
+            with self._ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 
                 if not info or 'entries' not in info:
                     return []
                 
                 entries = []
+                missing_titles = []
                 for i, entry in enumerate(info['entries'][:config.MAX_PLAYLIST_VIDEOS]):
                     if entry:
+                        if not entry.get('title') and entry.get('id'):
+                            missing_titles.append(len(entries))
                         entries.append({
                             'index': i + 1,
                             'id': entry.get('id', ''),
-                            'title': entry.get('title', f'Video {i+1}'),
+                            'title': entry.get('title') or f'Video {i+1}',
                             'url': entry.get('url', f"https://www.youtube.com/watch?v={entry.get('id', '')}"),
                             'duration': entry.get('duration', 0),
                             'thumbnail': f"https://img.youtube.com/vi/{entry.get('id', '')}/mqdefault.jpg"
                         })
+            
+            if missing_titles:
+                self._fill_entry_titles(entries, missing_titles, max_workers)
                 
             return entries
                 
@@ -721,12 +905,42 @@ class OptimizedYouTubeDownloader:
             logger.error(f"Playlist entries error: {e}")
             return []
     
+    def _fill_entry_titles(self, entries: List[Dict[str, Any]], indices: List[int],
+                           max_workers: Optional[int] = None):
+        """Resolve missing entry titles concurrently over the shared session"""
+        urls = [f"https://youtu.be/{entries[i]['id']}" for i in indices]
+        
+        if max_workers and max_workers != config.PLAYLIST_INFO_WORKERS:
+            with DaemonThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='info') as pool:
+                results = list(pool.map(self.get_video_info_fast, urls))
+        else:
+            results = list(self._executor.map(self.get_video_info_fast, urls))
+        
+        for i, info in zip(indices, results):
+            if info.get('title') and 'error' not in info:
+                entries[i]['title'] = info['title']
+    
     def cleanup(self):
         """Cleanup resources"""
         try:
             if hasattr(self, '_session'):
                 self._session.close()
             
+            if hasattr(self, '_executor'):
+                self._executor.shutdown(wait=False)
+            
+            if hasattr(self, '_download_pool'):
+                self._download_pool.shutdown(wait=False)
+            
+            if hasattr(self, '_ydl_instances'):
+                # Only idle instances are closed here; busy ones close when released
+                with self._ydl_instances_lock:
+                    self._ydl_closed = True
+                    idle = [ydl for instances in self._ydl_instances.values() for ydl in instances]
+                    self._ydl_instances.clear()
+                for ydl in idle:
+                    ydl.close()
+            
             # Clear caches
             self._video_info_cache.clear()
             self._thumbnail_cache.clear()
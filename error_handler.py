@@ -5,24 +5,49 @@ StreamScribe Error Handler Module
 Centralized error handling and user-friendly error messages
 """
 
-import traceback
+import logging
+import re
 import sys
-from typing import Optional, Dict, Any, Callable
-from enum import Enum
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, List, Mapping, Tuple
+from enum import IntEnum
+from config import config
 from logger import get_logger
+from utils import DaemonThreadPoolExecutor
 
 logger = get_logger('error_handler')
 
-
-class ErrorType(Enum):
-    """Error types for categorization"""
-    NETWORK = "network"
-    DOWNLOAD = "download"
-    GUI = "gui"
-    CONFIG = "config"
-    FILE = "file"
-    PERMISSION = "permission"
-    UNKNOWN = "unknown"
+# Shared daemon workers for safe_thread_execute instead of a fresh thread per call
+_EXECUTOR = DaemonThreadPoolExecutor(max_workers=config.BACKGROUND_WORKERS,
+                                     thread_name_prefix='streamscribe')
+
+
+class ErrorType(IntEnum):
+    """Error types for categorization; values double as dense list indices"""
+    NETWORK = 0
+    DOWNLOAD = 1
+    GUI = 2
+    CONFIG = 3
+    FILE = 4
+    PERMISSION = 5
+    UNKNOWN = 6
+
+
+# User-facing message per error type
+_USER_MESSAGES = {
+    ErrorType.NETWORK: "İnternet bağlantısı sorunu. Lütfen bağlantınızı kontrol edin.",
+    ErrorType.DOWNLOAD: "Video indirme hatası. Lütfen URL'yi kontrol edin ve tekrar deneyin.",
+    ErrorType.GUI: "Arayüz hatası. Lütfen uygulamayı yeniden başlatın.",
+    ErrorType.CONFIG: "Konfigürasyon hatası. Lütfen ayarları kontrol edin.",
+    ErrorType.FILE: "Dosya işleme hatası. Lütfen dosya izinlerini kontrol edin.",
+    ErrorType.PERMISSION: "İzin hatası. Lütfen yönetici olarak çalıştırmayı deneyin.",
+}
 
 
 class StreamScribeError(Exception):
@@ -33,92 +58,202 @@ class StreamScribeError(Exception):
         super().__init__(message)
         self.error_type = error_type
         self.original_error = original_error
-        self.user_message = user_message or message
-        self.traceback = traceback.format_exc()
+        self.user_message = user_message if user_message is not None else message
+        # Keep the active exception and only format it when someone asks
+        self._exc_info = sys.exc_info()
+        self._traceback: Optional[str] = None
+    
+    @property
+    def traceback(self) -> str:
+        """Formatted traceback of the exception active at construction time"""
+        if self._traceback is None:
+            if self._exc_info[0] is None:
+                self._traceback = ''
+            else:
+                self._traceback = ''.join(traceback.format_exception(*self._exc_info))
+            self._exc_info = (None, None, None)
+        return self._traceback
 
 
 class NetworkError(StreamScribeError):
     """Network-related errors"""
     
+    USER_MESSAGE = _USER_MESSAGES[ErrorType.NETWORK]
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(
             message, 
             ErrorType.NETWORK, 
             original_error,
-            "İnternet bağlantısı sorunu. Lütfen bağlantınızı kontrol edin."
+            self.USER_MESSAGE
         )
 
 
 class DownloadError(StreamScribeError):
     """Download-related errors"""
     
+    USER_MESSAGE = _USER_MESSAGES[ErrorType.DOWNLOAD]
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(
             message, 
             ErrorType.DOWNLOAD, 
             original_error,
-            "Video indirme hatası. Lütfen URL'yi kontrol edin ve tekrar deneyin."
+            self.USER_MESSAGE
         )
 
 
 class GUIError(StreamScribeError):
     """GUI-related errors"""
     
+    USER_MESSAGE = _USER_MESSAGES[ErrorType.GUI]
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(
             message, 
             ErrorType.GUI, 
             original_error,
-            "Arayüz hatası. Lütfen uygulamayı yeniden başlatın."
+            self.USER_MESSAGE
         )
 
 
 class ConfigError(StreamScribeError):
     """Configuration-related errors"""
     
+    USER_MESSAGE = _USER_MESSAGES[ErrorType.CONFIG]
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(
             message, 
             ErrorType.CONFIG, 
             original_error,
-            "Konfigürasyon hatası. Lütfen ayarları kontrol edin."
+            self.USER_MESSAGE
         )
 
 
 class FileError(StreamScribeError):
     """File-related errors"""
     
+    USER_MESSAGE = _USER_MESSAGES[ErrorType.FILE]
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(
             message, 
             ErrorType.FILE, 
             original_error,
-            "Dosya işleme hatası. Lütfen dosya izinlerini kontrol edin."
+            self.USER_MESSAGE
         )
 
 
-class PermissionError(StreamScribeError):
+class StreamScribePermissionError(StreamScribeError):
     """Permission-related errors"""
     
+    USER_MESSAGE = _USER_MESSAGES[ErrorType.PERMISSION]
+    
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         super().__init__(
             message, 
             ErrorType.PERMISSION, 
             original_error,
-            "İzin hatası. Lütfen yönetici olarak çalıştırmayı deneyin."
+            self.USER_MESSAGE
         )
 
 
+# Exception class raised for each category, so isinstance checks keep matching
+_CATEGORY_CLASS = {
+    ErrorType.NETWORK: NetworkError,
+    ErrorType.DOWNLOAD: DownloadError,
+    ErrorType.GUI: GUIError,
+    ErrorType.CONFIG: ConfigError,
+    ErrorType.FILE: FileError,
+    ErrorType.PERMISSION: StreamScribePermissionError,
+}
+
+
+def _make_error(error_type: ErrorType, message: str, original_error: Exception) -> StreamScribeError:
+    """Build the StreamScribeError subclass for a category"""
+    error_class = _CATEGORY_CLASS.get(error_type)
+    if error_class is None:
+        return StreamScribeError(message, error_type, original_error)
+    return error_class(message, original_error)
+
+
+# Built-in exception types that identify their category without a message scan
+_BUILTIN_CATEGORIES = (
+    ((ConnectionError, TimeoutError), ErrorType.NETWORK),
+    (PermissionError, ErrorType.PERMISSION),
+    (FileNotFoundError, ErrorType.FILE),
+)
+
+# Keywords per category in precedence order (GUI is matched on the type name)
+_MESSAGE_KEYWORDS = (
+    (ErrorType.NETWORK, ('connection', 'timeout', 'network', 'dns', 'ssl')),
+    (ErrorType.DOWNLOAD, ('download', 'extract', 'format', 'video', 'youtube')),
+    (ErrorType.FILE, ('file', 'directory', 'path', 'not found')),
+    (ErrorType.PERMISSION, ('permission', 'access', 'denied', 'forbidden')),
+    (ErrorType.CONFIG, ('config', 'setting', 'option')),
+)
+_GUI_KEYWORDS = ('tkinter', 'gui', 'widget')
+
+# Reverse map from keyword to category, scanned with a single alternation
+_KW_TO_CATEGORY: Dict[str, ErrorType] = {
+    sys.intern(keyword): error_type
+    for error_type, keywords in _MESSAGE_KEYWORDS
+    for keyword in keywords
+}
+_CATEGORY_RE = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(_KW_TO_CATEGORY, key=len, reverse=True)
+))
+_GUI_TYPE_RE = re.compile('|'.join(_GUI_KEYWORDS))
+
+# Categories in the order they take precedence when several keywords match
+_CATEGORY_PRIORITY = (
+    ErrorType.NETWORK,
+    ErrorType.DOWNLOAD,
+    ErrorType.FILE,
+    ErrorType.PERMISSION,
+    ErrorType.GUI,
+    ErrorType.CONFIG,
+)
+_TOP_CATEGORY = _CATEGORY_PRIORITY[0]
+
+
+@lru_cache(maxsize=512)
+def _classify(type_name: str, message: str) -> ErrorType:
+    """Classify an error by its casefolded exception type name and message"""
+    found = set()
+    for match in _CATEGORY_RE.finditer(message):
+        error_type = _KW_TO_CATEGORY[match.group()]
+        if error_type is _TOP_CATEGORY:
+            # Nothing can outrank the first category
+            return error_type
+        found.add(error_type)
+    if _GUI_TYPE_RE.search(type_name):
+        found.add(ErrorType.GUI)
+    
+    for error_type in _CATEGORY_PRIORITY:
+        if error_type in found:
+            return error_type
+    return ErrorType.UNKNOWN
+
+
+# Distinct recent errors kept for duplicate log suppression
+_RECENT_ERRORS_MAX = 64
+
+
 class ErrorHandler:
     """Centralized error handler for StreamScribe"""
     
     def __init__(self):
-        self.error_callbacks: Dict[ErrorType, Callable] = {}
+        self._callbacks: List[Optional[Callable]] = [None] * len(ErrorType)
         self.general_error_callback: Optional[Callable] = None
+        # [suppressed repeats, last logged time] of recently logged (type name, message) pairs
+        self._recent_errors: OrderedDict = OrderedDict()
+        self._recent_lock = threading.Lock()
     
     def set_error_callback(self, error_type: ErrorType, callback: Callable):
         """Set error callback for specific error type"""
-        self.error_callbacks[error_type] = callback
+        self._callbacks[error_type] = callback
     
     def set_general_error_callback(self, callback: Callable):
         """Set general error callback for all errors"""
@@ -127,16 +262,26 @@ class ErrorHandler:
     def handle_error(self, error: Exception, context: str = "") -> str:
         """Handle error and return user-friendly message"""
         try:
-            # Log the error
-            logger.error(f"Error in {context}: {error}")
-            logger.debug(f"Error traceback: {traceback.format_exc()}")
+            message = str(error)
+            
+            # Log the error once per window; the traceback is only rendered when DEBUG is on
+            if self._first_occurrence((type(error).__name__, message)):
+                logger.error("Error in %s: %s", context, error,
+                             exc_info=logger.isEnabledFor(logging.DEBUG))
             
             # Determine error type and create appropriate exception
-            streamscribe_error = self._categorize_error(error)
+            if isinstance(error, StreamScribeError):
+                # Already categorized where it was raised
+                streamscribe_error = error
+            else:
+                streamscribe_error = self._categorize_error(
+                    error, message, type(error).__name__.casefold(), message.casefold()
+                )
             
             # Call specific error callback if available
-            if streamscribe_error.error_type in self.error_callbacks:
-                self.error_callbacks[streamscribe_error.error_type](streamscribe_error)
+            callback = self._callbacks[streamscribe_error.error_type]
+            if callback:
+                callback(streamscribe_error)
             
             # Call general error callback if available
             if self.general_error_callback:
@@ -145,40 +290,69 @@ class ErrorHandler:
             return streamscribe_error.user_message
             
         except Exception as e:
-            logger.error(f"Error in error handler: {e}")
+            logger.error("Error in error handler: %s", e)
             return "Beklenmeyen bir hata oluştu. Lütfen uygulamayı yeniden başlatın."
     
-    def _categorize_error(self, error: Exception) -> StreamScribeError:
-        """Categorize error and create appropriate StreamScribeError"""
-        error_str = str(error).lower()
-        error_type = type(error).__name__.lower()
+    def _first_occurrence(self, key: Tuple[str, str]) -> bool:
+        """Record an error key and report whether it needs to be logged
         
-        # Network errors
-        if any(keyword in error_str for keyword in ['connection', 'timeout', 'network', 'dns', 'ssl']):
-            return NetworkError(str(error), error)
+        A repeated error is logged again, after a summary of its suppressed
+        repeats, once ERROR_REPEAT_LOG_INTERVAL has passed since it was last logged.
+        """
+        now = time.monotonic()
+        summary = None
+        with self._recent_lock:
+            entry = self._recent_errors.get(key)
+            if entry is not None:
+                self._recent_errors.move_to_end(key)
+                if now - entry[1] < config.ERROR_REPEAT_LOG_INTERVAL:
+                    entry[0] += 1
+                    return False
+                summary = (key, entry[0])
+                entry[0], entry[1] = 0, now
+            else:
+                self._recent_errors[key] = [0, now]
+                if len(self._recent_errors) > _RECENT_ERRORS_MAX:
+                    evicted, (repeats, _) = self._recent_errors.popitem(last=False)
+                    summary = (evicted, repeats)
         
-        # Download errors
-        if any(keyword in error_str for keyword in ['download', 'extract', 'format', 'video', 'youtube']):
-            return DownloadError(str(error), error)
-        
-        # File errors
-        if any(keyword in error_str for keyword in ['file', 'directory', 'path', 'not found']):
-            return FileError(str(error), error)
-        
-        # Permission errors
-        if any(keyword in error_str for keyword in ['permission', 'access', 'denied', 'forbidden']):
-            return PermissionError(str(error), error)
+        if summary is not None:
+            self._log_repeats(*summary)
+        return True
+    
+    @staticmethod
+    def _log_repeats(key: Tuple[str, str], repeats: int):
+        """Emit the summary line for suppressed duplicates of one error"""
+        if repeats:
+            logger.error("%s: %s (x%d more occurrences)", key[0], key[1], repeats)
+    
+    def flush_error_log(self):
+        """Log summaries for suppressed duplicate errors and reset the window"""
+        with self._recent_lock:
+            recent = list(self._recent_errors.items())
+            self._recent_errors.clear()
+        for key, (repeats, _) in recent:
+            self._log_repeats(key, repeats)
+    
+    def _categorize_error(self, error: Exception, message: Optional[str] = None,
+                          type_lc: Optional[str] = None,
+                          message_lc: Optional[str] = None) -> StreamScribeError:
+        """Categorize error and create appropriate StreamScribeError
         
-        # GUI errors
-        if any(keyword in error_type for keyword in ['tkinter', 'gui', 'widget']):
-            return GUIError(str(error), error)
+        Callers that already hold str(error) and the casefolded strings can pass them in.
+        """
+        if message is None:
+            message = str(error)
         
-        # Config errors
-        if any(keyword in error_str for keyword in ['config', 'setting', 'option']):
-            return ConfigError(str(error), error)
+        for error_types, error_type in _BUILTIN_CATEGORIES:
+            if isinstance(error, error_types):
+                return _make_error(error_type, message, error)
         
-        # Default to unknown error
-        return StreamScribeError(str(error), ErrorType.UNKNOWN, error)
+        if type_lc is None:
+            type_lc = type(error).__name__.casefold()
+        if message_lc is None:
+            message_lc = message.casefold()
+        return _make_error(_classify(type_lc, message_lc), message, error)
     
     def safe_execute(self, func: Callable, *args, **kwargs) -> Any:
         """Safely execute a function with error handling"""
@@ -187,10 +361,8 @@ class ErrorHandler:
         except Exception as e:
             return self.handle_error(e, f"Function: {func.__name__}")
     
-    def safe_thread_execute(self, func: Callable, callback: Callable, *args, **kwargs):
-        """Safely execute a function in a thread with error handling"""
-        import threading
-        
+    def safe_thread_execute(self, func: Callable, callback: Callable, *args, **kwargs) -> Future:
+        """Safely execute a function on the background pool with error handling"""
         def thread_worker():
             try:
                 result = func(*args, **kwargs)
@@ -199,9 +371,7 @@ class ErrorHandler:
                 error_msg = self.handle_error(e, f"Thread function: {func.__name__}")
                 callback(None, error_msg)
         
-        thread = threading.Thread(target=thread_worker, daemon=True)
-        thread.start()
-        return thread
+        return _EXECUTOR.submit(thread_worker)
 
 
 # Global error handler instance
@@ -213,56 +383,70 @@ def handle_error(error: Exception, context: str = "") -> str:
     return error_handler.handle_error(error, context)
 
 
+def flush_error_log():
+    """Convenience function to log suppressed duplicate errors"""
+    error_handler.flush_error_log()
+
+
 def safe_execute(func: Callable, *args, **kwargs) -> Any:
     """Convenience function to safely execute functions"""
     return error_handler.safe_execute(func, *args, **kwargs)
 
 
-def safe_thread_execute(func: Callable, callback: Callable, *args, **kwargs):
-    """Convenience function to safely execute functions in threads"""
+def safe_thread_execute(func: Callable, callback: Callable, *args, **kwargs) -> Future:
+    """Convenience function to safely execute functions in background threads"""
     return error_handler.safe_thread_execute(func, callback, *args, **kwargs)
 
 
-# Error message templates
-ERROR_MESSAGES = {
-    ErrorType.NETWORK: {
-        'timeout': 'Bağlantı zaman aşımı. İnternet bağlantınızı kontrol edin.',
-        'connection': 'İnternet bağlantısı sorunu. Lütfen bağlantınızı kontrol edin.',
-        'dns': 'DNS çözümleme hatası. İnternet bağlantınızı kontrol edin.',
-        'ssl': 'SSL sertifika hatası. Güvenlik ayarlarınızı kontrol edin.'
-    },
-    ErrorType.DOWNLOAD: {
-        'video_not_found': 'Video bulunamadı. URL\'yi kontrol edin.',
-        'private_video': 'Video özel veya kısıtlı. Bu videoyu indiremezsiniz.',
-        'age_restricted': 'Yaş kısıtlamalı video. Bu videoyu indiremezsiniz.',
-        'format_not_available': 'İstenen format mevcut değil. Farklı bir kalite seçin.',
-        'playlist_empty': 'Playlist boş veya erişilemez.',
-        'quota_exceeded': 'YouTube API kotası aşıldı. Lütfen daha sonra tekrar deneyin.'
-    },
-    ErrorType.FILE: {
-        'not_found': 'Dosya bulunamadı.',
-        'permission_denied': 'Dosya izni reddedildi.',
-        'disk_full': 'Disk alanı dolu. Lütfen alan açın.',
-        'invalid_path': 'Geçersiz dosya yolu.',
-        'file_in_use': 'Dosya kullanımda. Lütfen diğer programları kapatın.'
-    },
-    ErrorType.GUI: {
-        'widget_destroyed': 'Arayüz bileşeni yok edildi.',
-        'thread_error': 'Arayüz thread hatası.',
-        'display_error': 'Görüntüleme hatası.',
-        'event_error': 'Olay işleme hatası.'
-    },
-    ErrorType.CONFIG: {
-        'invalid_setting': 'Geçersiz ayar değeri.',
-        'config_not_found': 'Konfigürasyon dosyası bulunamadı.',
-        'config_corrupt': 'Konfigürasyon dosyası bozuk.',
-        'setting_not_found': 'Ayar bulunamadı.'
-    }
+def guarded(context: str = ""):
+    """Decorator form of safe_execute with the context string fixed at decoration time"""
+    def decorator(func):
+        error_context = context or f"Function: {func.__name__}"
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return error_handler.handle_error(e, error_context)
+        return wrapper
+    return decorator
+
+
+# Error message templates, keyed by (error type, error key)
+_RAW_ERROR_MESSAGES: Dict[Tuple[ErrorType, str], str] = {
+    (ErrorType.NETWORK, 'timeout'): 'Bağlantı zaman aşımı. İnternet bağlantınızı kontrol edin.',
+    (ErrorType.NETWORK, 'connection'): 'İnternet bağlantısı sorunu. Lütfen bağlantınızı kontrol edin.',
+    (ErrorType.NETWORK, 'dns'): 'DNS çözümleme hatası. İnternet bağlantınızı kontrol edin.',
+    (ErrorType.NETWORK, 'ssl'): 'SSL sertifika hatası. Güvenlik ayarlarınızı kontrol edin.',
+    (ErrorType.DOWNLOAD, 'video_not_found'): "Video bulunamadı. URL'yi kontrol edin.",
+    (ErrorType.DOWNLOAD, 'private_video'): 'Video özel veya kısıtlı. Bu videoyu indiremezsiniz.',
+    (ErrorType.DOWNLOAD, 'age_restricted'): 'Yaş kısıtlamalı video. Bu videoyu indiremezsiniz.',
+    (ErrorType.DOWNLOAD, 'format_not_available'): 'İstenen format mevcut değil. Farklı bir kalite seçin.',
+    (ErrorType.DOWNLOAD, 'playlist_empty'): 'Playlist boş veya erişilemez.',
+    (ErrorType.DOWNLOAD, 'quota_exceeded'): 'YouTube API kotası aşıldı. Lütfen daha sonra tekrar deneyin.',
+    (ErrorType.FILE, 'not_found'): 'Dosya bulunamadı.',
+    (ErrorType.FILE, 'permission_denied'): 'Dosya izni reddedildi.',
+    (ErrorType.FILE, 'disk_full'): 'Disk alanı dolu. Lütfen alan açın.',
+    (ErrorType.FILE, 'invalid_path'): 'Geçersiz dosya yolu.',
+    (ErrorType.FILE, 'file_in_use'): 'Dosya kullanımda. Lütfen diğer programları kapatın.',
+    (ErrorType.GUI, 'widget_destroyed'): 'Arayüz bileşeni yok edildi.',
+    (ErrorType.GUI, 'thread_error'): 'Arayüz thread hatası.',
+    (ErrorType.GUI, 'display_error'): 'Görüntüleme hatası.',
+    (ErrorType.GUI, 'event_error'): 'Olay işleme hatası.',
+    (ErrorType.CONFIG, 'invalid_setting'): 'Geçersiz ayar değeri.',
+    (ErrorType.CONFIG, 'config_not_found'): 'Konfigürasyon dosyası bulunamadı.',
+    (ErrorType.CONFIG, 'config_corrupt'): 'Konfigürasyon dosyası bozuk.',
+    (ErrorType.CONFIG, 'setting_not_found'): 'Ayar bulunamadı.',
 }
 
+# Read-only view with interned keys and templates
+ERROR_MESSAGES: Mapping[Tuple[ErrorType, str], str] = MappingProxyType({
+    (error_type, sys.intern(key)): sys.intern(message)
+    for (error_type, key), message in _RAW_ERROR_MESSAGES.items()
+})
+
 
 def get_user_friendly_message(error_type: ErrorType, error_key: str) -> str:
     """Get user-friendly error message"""
-    if error_type in ERROR_MESSAGES and error_key in ERROR_MESSAGES[error_type]:
-        return ERROR_MESSAGES[error_type][error_key]
-    return "Beklenmeyen bir hata oluştu."
+    return ERROR_MESSAGES.get((error_type, error_key), "Beklenmeyen bir hata oluştu.")
@@ -5,29 +5,116 @@ StreamScribe Optimized GUI Module
 Modern, optimized GUI interface with improved performance and user experience
 """
 
+import contextlib
+import functools
+import hashlib
 import os
+import queue
+import re
 import sys
 import threading
 import time
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from collections import OrderedDict
+from concurrent.futures import as_completed
+from tkinter import messagebox, filedialog, ttk
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import customtkinter as ctk
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
+from PIL import Image
+from urllib3.util.retry import Retry
 
 from config import config
 from logger import get_logger, setup_logging
 from downloader import OptimizedYouTubeDownloader
+from utils import perf_optimizer, DaemonThreadPoolExecutor
+
+# libvips decodes JPEGs straight at thumbnail size; Pillow is the fallback
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
 
 logger = get_logger('gui')
 
+# YouTube thumbnail variants larger than the info panel needs
+_LARGE_THUMBNAIL_RE = re.compile(r'/(?:maxres|sd|hq)default\.jpg')
+
+# Characters that are not allowed in folder names on Windows
+_INVALID_FS_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# Any page on youtube.com (any subdomain) or youtu.be; yt-dlp decides what it can extract
+_URL_RE = re.compile(
+    r'^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)[/?]\S+$',
+    re.IGNORECASE
+)
+
+# Info panel text, filled in once per analysis
+_DETAILS_TEMPLATE = (
+    "📺 Başlık: {title}\n\n"
+    "🔗 Video ID: {video_id}\n\n"
+    "📋 Tür: {kind}\n\n"
+    "⚡ Yöntem: {method}\n\n"
+    "{summary}"
+)
+_PLAYLIST_SUMMARY = (
+    "📊 Video Sayısı: {count}\n\n"
+    "✅ Playlist analizi tamamlandı.\nAşağıdaki listeden tek tek video indirebilirsiniz."
+)
+_VIDEO_SUMMARY = "✅ Video analizi tamamlandı.\nİndirme için ayarları yapın ve 'İNDİR' butonuna tıklayın."
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_duration(seconds: int) -> str:
+    """Format a whole-second duration for the progress line; each value is formatted once"""
+    if seconds > 60:
+        return f"{seconds // 60}dk {seconds % 60}s"
+    return f"{seconds}s"
+
+
+def _decode_thumbnail(stream) -> Image.Image:
+    """Decode an image stream into an RGB PIL image of config.THUMBNAIL_SIZE"""
+    width, height = config.THUMBNAIL_SIZE
+    if pyvips is not None:
+        vips_image = pyvips.Image.thumbnail_buffer(stream.read(), width, height=height, size='force')
+        vips_image = vips_image.colourspace('srgb')
+        if vips_image.bands > 3:
+            vips_image = vips_image.extract_band(0, n=3)
+        return Image.frombytes("RGB", (vips_image.width, vips_image.height), vips_image.write_to_memory())
+    
+    image = Image.open(stream)
+    # Let the JPEG decoder downscale via DCT before the resize filter runs
+    image.draft('RGB', config.THUMBNAIL_SIZE)
+    return image.resize(config.THUMBNAIL_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+def _format_mib(size: int) -> str:
+    """Format a byte count as MiB with one (truncated) decimal using integer arithmetic"""
+    size = int(size)
+    whole = size >> 20
+    tenths = ((size & 0xFFFFF) * 10) >> 20
+    return f"{whole}.{tenths}MB"
+
 
 class StreamScribeOptimizedGUI:
     """Optimized StreamScribe GUI with modern design and improved performance"""
     
+    # Header label fonts as (size, weight), keyed by maximized layout
+    HEADER_FONT_SIZES = {
+        False: {'title': (24, "bold"), 'subtitle': (12, "normal"), 'version': (10, "normal")},
+        True: {'title': (32, "bold"), 'subtitle': (18, "normal"), 'version': (14, "normal")},
+    }
+    
+    # Playlist row tag colours and the status icon shown for each download state
+    PLAYLIST_TAG_COLORS = {
+        'pending': "#ffa500",
+        'downloading': "#ffa500",
+        'completed': "#4CAF50",
+        'failed': "#f44336",
+        'muted': "#888888",
+    }
+    PLAYLIST_STATUS_ICONS = {'downloading': "⏳", 'completed': "✅", 'failed': "❌"}
+    
     def __init__(self):
         # Setup logging
         setup_logging(config.LOG_LEVEL)
@@ -39,10 +126,9 @@ class StreamScribeOptimizedGUI:
         # Create main window
         self.root = ctk.CTk()
         self.root.title(f"{config.APP_NAME} - YouTube Video İndirici")
-        self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
         self.root.minsize(config.MIN_WINDOW_WIDTH, config.MIN_WINDOW_HEIGHT)
         
-        # Center window
+        # Size and center the window in a single geometry call
         self._center_window()
         
         # Set icon
@@ -54,15 +140,86 @@ class StreamScribeOptimizedGUI:
         self.download_start_time: Optional[float] = None
         
         # Cache for thumbnails and video info
-        self._thumbnail_cache: Dict[str, ctk.CTkImage] = {}
+        self._thumbnail_cache: "OrderedDict[str, ctk.CTkImage]" = OrderedDict()  # Tk thread only
         self._video_info_cache: Dict[str, Dict[str, Any]] = {}
+        # Thumbnail URLs currently being fetched, so repeat requests are dropped
+        self._thumbnails_inflight: set = set()
+        self._thumbnail_lock = threading.Lock()
+        
+        # Bounded worker pool for analysis, thumbnail I/O and the bulk download coordinator
+        self._io_pool = DaemonThreadPoolExecutor(max_workers=config.GUI_IO_WORKERS, thread_name_prefix="gui-io")
+        # One long-lived daemon thread runs single-video downloads in the order they were queued
+        self._download_queue: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue()
+        self._download_thread = threading.Thread(target=self._download_loop, name="download", daemon=True)
+        self._download_thread.start()
+        
+        # Pooled keep-alive connections for thumbnail fetches
+        self._http = perf_optimizer.get_session(
+            "thumbnail",
+            pool_maxsize=config.GUI_IO_WORKERS,  # one kept-alive socket per worker
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        
+        # Resized thumbnails persist across sessions on disk
+        self._thumbnail_dir = Path(config.THUMBNAIL_DISK_CACHE_DIR)
+        try:
+            self._thumbnail_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Thumbnail cache directory unavailable: {e}")
+        
+        # Last URL entry state seen by _do_url_check, and its pending timer
+        self._url_check_after: Optional[str] = None
+        self._last_url: Optional[str] = None
+        self._url_valid: Optional[bool] = None
+        
+        # Layout state; layout updates are no-ops until _create_ui has finished
+        self._ui_built = False
+        self.is_fullscreen = False
+        self._layout_after: Optional[str] = None
+        # Mode the widgets were last laid out for (the UI is built in normal mode)
+        self._applied_fullscreen = False
+        self.screen_width = config.WINDOW_WIDTH
+        self.screen_height = config.WINDOW_HEIGHT
+        # Grid-managed debug widgets hidden in maximized mode; grid_remove
+        # keeps their cell options so showing them again is a plain grid()
+        self._debug_widgets: list = []
+        
+        # Shared fonts; the header owns its fonts and resizes them in place
+        self._fonts: Dict[tuple, ctk.CTkFont] = {}
+        self._header_fonts = {
+            key: ctk.CTkFont(size=size, weight=weight)
+            for key, (size, weight) in self.HEADER_FONT_SIZES[False].items()
+        }
+        
+        # Latest download progress, applied to the UI by _flush_progress
+        self._pending_progress: Optional[tuple] = None
+        # Latest progress text per playlist row during a bulk download
+        self._pending_rows: Dict[int, str] = {}
+        self._progress_lock = threading.Lock()
+        # Set once the window is closing; background threads stop posting to Tk
+        self._closing = False
+        self._last_progress_ts = 0.0
+        self._last_status_text: Optional[str] = None
+        self._last_progress_error: tuple = (None, 0.0)
+        self._progress_interval = config.PROGRESS_REFRESH_MS / 1000
         
         # Playlist management
         self.playlist_items: list = []
+        self._playlist_load_generation = 0
+        self.playlist_entries: list = []
+        self.playlist_download_status: Dict[int, Dict[str, Any]] = {}
         self.bulk_download_active = False
+        self.bulk_download_index = 0
+        self.bulk_download_total = 0
+        self.current_playlist_output_dir: Optional[str] = None
+        # Created playlist folders by (output dir, playlist name), reused for the session
+        self._playlist_dir_cache: Dict[tuple, str] = {}
+        self._bulk_pool: Optional[DaemonThreadPoolExecutor] = None
+        self._folder_banner: Optional[ctk.CTkFrame] = None
         self.current_playlist_info: Optional[Dict[str, Any]] = None
         self.playlist_download_index = 0
         self.playlist_total_videos = 0
+        self._playlist_prefix = ""  # "📋 <name> - " for progress lines, set with current_playlist_info
         
         # Create UI
         self._create_ui()
@@ -75,9 +232,8 @@ class StreamScribeOptimizedGUI:
     
     def _center_window(self):
         """Center the window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # The normal-mode size is known up front; avoid forcing a geometry pass
+        width, height = config.WINDOW_WIDTH, config.WINDOW_HEIGHT
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
@@ -101,22 +257,40 @@ class StreamScribeOptimizedGUI:
             self.is_fullscreen = True
             
             # Adjust layout for fullscreen
-            self._adjust_layout_for_fullscreen()
-            
-            pass
-        except Exception as e:
-            pass
+            self._schedule_layout_update()
+        except Exception:
             # Fallback to normal window
             try:
-                self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
                 self._center_window()
-            except:
+            except Exception:
                 pass
     
+    def _schedule_layout_update(self):
+        """Apply the layout for the current mode once the event loop is idle
+        
+        Rapid toggles collapse into a single pass over fonts, panels and debug widgets.
+        """
+        if self._layout_after is None:
+            self._layout_after = self.root.after_idle(self._apply_layout)
+    
+    def _apply_layout(self):
+        """Run the pending layout update for the current mode"""
+        self._layout_after = None
+        if not self._ui_built or self.is_fullscreen == self._applied_fullscreen:
+            # Toggled back before the loop went idle; nothing to reconfigure
+            return
+        self._applied_fullscreen = self.is_fullscreen
+        if self.is_fullscreen:
+            self._adjust_layout_for_fullscreen()
+        else:
+            self._restore_normal_layout()
+    
     def _adjust_layout_for_fullscreen(self):
         """Adjust layout elements for maximized mode"""
-        try:
-            if hasattr(self, 'is_fullscreen') and self.is_fullscreen:
+        if not self._ui_built:
+            return
+        with contextlib.suppress(Exception):
+            if self.is_fullscreen:
                 # Increase font sizes
                 self._update_font_sizes(large=True)
                 
@@ -125,96 +299,69 @@ class StreamScribeOptimizedGUI:
                 
                 # Hide debug elements in maximized mode
                 self._hide_debug_elements()
-                
-                pass
-        except Exception as e:
-            pass
     
     def _update_font_sizes(self, large=False):
         """Update font sizes based on screen mode"""
-        try:
-            if large:
-                # Larger fonts for fullscreen
-                self.title_font = ctk.CTkFont(size=32, weight="bold")
-                self.header_font = ctk.CTkFont(size=20, weight="bold")
-                self.normal_font = ctk.CTkFont(size=16)
-                self.small_font = ctk.CTkFont(size=14)
-                
-                # Update header fonts
-                if hasattr(self, 'title_label'):
-                    self.title_label.configure(font=ctk.CTkFont(size=32, weight="bold"))
-                if hasattr(self, 'subtitle_label'):
-                    self.subtitle_label.configure(font=ctk.CTkFont(size=18))
-                if hasattr(self, 'version_label'):
-                    self.version_label.configure(font=ctk.CTkFont(size=14))
-            else:
-                # Normal fonts for windowed mode
-                self.title_font = ctk.CTkFont(size=24, weight="bold")
-                self.header_font = ctk.CTkFont(size=18, weight="bold")
-                self.normal_font = ctk.CTkFont(size=14)
-                self.small_font = ctk.CTkFont(size=12)
-                
-                # Update header fonts
-                if hasattr(self, 'title_label'):
-                    self.title_label.configure(font=ctk.CTkFont(size=24, weight="bold"))
-                if hasattr(self, 'subtitle_label'):
-                    self.subtitle_label.configure(font=ctk.CTkFont(size=12))
-                if hasattr(self, 'version_label'):
-                    self.version_label.configure(font=ctk.CTkFont(size=10))
-        except Exception as e:
-            pass
+        if not self._ui_built:
+            return
+        with contextlib.suppress(Exception):
+            # Every label using a header font follows the font's new size
+            for key, (size, weight) in self.HEADER_FONT_SIZES[large].items():
+                self._header_fonts[key].configure(size=size, weight=weight)
+    
+    def _font(self, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Shared CTkFont for a size/weight, created on first use"""
+        font = self._fonts.get((size, weight))
+        if font is None:
+            font = self._fonts[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+        return font
     
     def _update_panel_widths(self):
         """Update panel widths for fullscreen mode"""
-        try:
-            if hasattr(self, 'left_panel') and hasattr(self, 'right_panel'):
-                if self.is_fullscreen:
-                    # Better proportions for fullscreen
-                    left_width = int(self.screen_width * 0.45)  # 45% of screen
-                    right_width = int(self.screen_width * 0.45)  # 45% of screen
-                    spacing = int(self.screen_width * 0.1)      # 10% spacing
-                else:
-                    # Normal proportions
-                    left_width = 420
-                    right_width = 380
-                    spacing = 16
-                
-                # Update panel widths
-                self.left_panel.configure(width=left_width)
-                self.right_panel.configure(width=right_width)
-                
-                pass
-        except Exception as e:
-            pass
+        if not self._ui_built:
+            return
+        with contextlib.suppress(Exception):
+            if self.is_fullscreen:
+                # Better proportions for fullscreen
+                left_width = int(self.screen_width * 0.45)  # 45% of screen
+                right_width = int(self.screen_width * 0.45)  # 45% of screen
+                spacing = int(self.screen_width * 0.1)      # 10% spacing
+            else:
+                # Normal proportions
+                left_width = 420
+                right_width = 380
+                spacing = 16
+            
+            # Update panel widths
+            self.left_panel.configure(width=left_width)
+            self.right_panel.configure(width=right_width)
     
     def _hide_debug_elements(self):
         """Hide debug elements in maximized mode"""
-        try:
-            # Hide network debug section
-            if hasattr(self, 'network_frame'):
-                self.network_frame.pack_forget()
-            
-            # Hide other debug elements
-            if hasattr(self, 'debug_label'):
-                self.debug_label.pack_forget()
-                
-        except Exception as e:
-            pass
+        if not self._ui_built:
+            return
+        with contextlib.suppress(Exception):
+            for widget in self._debug_widgets:
+                widget.grid_remove()
     
     def _set_window_icon(self):
         """Set window icon if available"""
-        try:
-            icon_path = Path(__file__).parent / "logo" / "favicon.ico"
-            if icon_path.exists():
-                self.root.iconbitmap(str(icon_path))
-        except Exception as e:
-            pass
+        logo_dir = Path(__file__).parent / "logo"
+        self._icon_photo: Optional[tk.PhotoImage] = None
+        with contextlib.suppress(Exception):
+            # Decoded once; default=True makes child windows inherit the icon.
+            # Keep the reference so Tk does not lose the image to GC.
+            self._icon_photo = tk.PhotoImage(file=str(logo_dir / "favicon-32x32.png"))
+            self.root.iconphoto(True, self._icon_photo)
+        if sys.platform == "win32":
+            with contextlib.suppress(Exception):
+                # Multi-resolution .ico for the Windows taskbar
+                self.root.iconbitmap(str(logo_dir / "favicon.ico"))
     
     def _create_ui(self):
         """Create the main UI layout"""
         # Main container
         main_frame = ctk.CTkFrame(self.root, corner_radius=10)
-        main_frame.pack(fill="both", expand=True, padx=8, pady=8)
         
         # Header
         self._create_header(main_frame)
@@ -237,8 +384,17 @@ class StreamScribeOptimizedGUI:
         self._create_control_panel(self.left_panel)
         self._create_info_panel(self.right_panel)
         
+        # Map the finished tree in one go so Tk lays it out once instead
+        # of growing the visible window child by child
+        main_frame.pack(fill="both", expand=True, padx=8, pady=8)
+        
         # Bind keyboard shortcuts
         self._bind_shortcuts()
+        
+        self._ui_built = True
+        
+        # Start the fixed-rate progress refresh
+        self.root.after(config.PROGRESS_REFRESH_MS, self._flush_progress)
     
     def _bind_shortcuts(self):
         """Bind keyboard shortcuts"""
@@ -249,44 +405,34 @@ class StreamScribeOptimizedGUI:
     
     def _toggle_fullscreen(self, event=None):
         """Toggle between maximized and normal window mode"""
-        try:
+        with contextlib.suppress(Exception):
             if self.is_fullscreen:
                 # Exit maximized mode
                 self.root.state('normal')
-                self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
                 self._center_window()
                 self.is_fullscreen = False
-                self._restore_normal_layout()
-                pass
+                self._schedule_layout_update()
             else:
                 # Enter maximized mode
                 self.root.state('zoomed')
                 self.is_fullscreen = True
-                self._adjust_layout_for_fullscreen()
-                pass
-        except Exception as e:
-            pass
+                self._schedule_layout_update()
     
     def _exit_fullscreen(self, event=None):
         """Exit maximized mode"""
-        try:
+        with contextlib.suppress(Exception):
             self.root.state('normal')
-            self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
             self._center_window()
             
             # Reset fullscreen flag
             self.is_fullscreen = False
             
             # Restore normal layout
-            self._restore_normal_layout()
-            
-            pass
-        except Exception as e:
-            pass
+            self._schedule_layout_update()
     
     def _restore_normal_layout(self):
         """Restore normal layout when exiting maximized mode"""
-        try:
+        with contextlib.suppress(Exception):
             # Restore normal font sizes
             self._update_font_sizes(large=False)
             
@@ -295,25 +441,14 @@ class StreamScribeOptimizedGUI:
             
             # Show debug elements again
             self._show_debug_elements()
-            
-            pass
-        except Exception as e:
-            pass
     
     def _show_debug_elements(self):
         """Show debug elements when exiting maximized mode"""
-        try:
-            # Show network debug section
-            if hasattr(self, 'network_frame'):
-                self.network_frame.pack(side="bottom", fill="x", padx=8, pady=4)
-            
-            # Show other debug elements
-            if hasattr(self, 'debug_label'):
-                self.debug_label.pack(side="bottom", fill="x", padx=8, pady=2)
-                
-            pass
-        except Exception as e:
-            pass
+        if not self._ui_built:
+            return
+        with contextlib.suppress(Exception):
+            for widget in self._debug_widgets:
+                widget.grid()
     
     def _create_header(self, parent):
         """Create header with title and version"""
@@ -325,7 +460,7 @@ class StreamScribeOptimizedGUI:
         self.title_label = ctk.CTkLabel(
             header_frame,
             text=f"🎬 {config.APP_NAME}",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self._header_fonts['title'],
             text_color=("#ffffff", "#ffffff")
         )
         self.title_label.pack(side="left", padx=15, pady=15)
@@ -334,7 +469,7 @@ class StreamScribeOptimizedGUI:
         self.subtitle_label = ctk.CTkLabel(
             header_frame,
             text="YouTube Video İndirici",
-            font=ctk.CTkFont(size=12),
+            font=self._header_fonts['subtitle'],
             text_color=("#cccccc", "#cccccc")
         )
         self.subtitle_label.pack(side="left", padx=(0, 15), pady=15)
@@ -343,7 +478,7 @@ class StreamScribeOptimizedGUI:
         self.version_label = ctk.CTkLabel(
             header_frame,
             text=f"v{config.APP_VERSION}",
-            font=ctk.CTkFont(size=10),
+            font=self._header_fonts['version'],
             text_color=("#888888", "#888888")
         )
         self.version_label.pack(side="right", padx=15, pady=15)
@@ -357,7 +492,7 @@ class StreamScribeOptimizedGUI:
         url_label = ctk.CTkLabel(
             url_frame, 
             text="YouTube URL:", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold")
         )
         url_label.pack(anchor="w", padx=15, pady=(15, 5))
         
@@ -365,7 +500,7 @@ class StreamScribeOptimizedGUI:
             url_frame,
             placeholder_text="https://www.youtube.com/watch?v=...",
             height=35,
-            font=ctk.CTkFont(size=12)
+            font=self._font(12)
         )
         self.url_entry.pack(fill="x", padx=15, pady=(0, 8))
         self.url_entry.bind("<KeyRelease>", self._on_url_change)
@@ -377,7 +512,7 @@ class StreamScribeOptimizedGUI:
             text="🔍 Analiz Et",
             height=30,
             command=self._analyze_video,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold"),
             state="disabled"
         )
         self.analyze_btn.pack(pady=(0, 15))
@@ -389,7 +524,7 @@ class StreamScribeOptimizedGUI:
         options_label = ctk.CTkLabel(
             options_frame, 
             text="İndirme Seçenekleri:", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold")
         )
         options_label.pack(anchor="w", padx=15, pady=(15, 8))
         
@@ -404,7 +539,7 @@ class StreamScribeOptimizedGUI:
         format_label = ctk.CTkLabel(
             format_frame, 
             text="📁 Format:", 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font(12, "bold")
         )
         format_label.pack(anchor="w", padx=12, pady=(12, 8))
         
@@ -420,7 +555,7 @@ class StreamScribeOptimizedGUI:
             text="🎥 Video (MP4)",
             variable=self.format_var,
             value="video",
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             command=self._on_format_change
         )
         video_radio.pack(anchor="w", pady=3)
@@ -431,7 +566,7 @@ class StreamScribeOptimizedGUI:
             text="🎵 Ses (MP3)",
             variable=self.format_var,
             value="audio",
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             command=self._on_format_change
         )
         audio_radio.pack(anchor="w", pady=3)
@@ -443,7 +578,7 @@ class StreamScribeOptimizedGUI:
         quality_label = ctk.CTkLabel(
             quality_frame, 
             text="⚡ Kalite:", 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font(12, "bold")
         )
         quality_label.pack(anchor="w", padx=12, pady=(12, 8))
         
@@ -453,8 +588,8 @@ class StreamScribeOptimizedGUI:
             values=["4K", "1440p", "1080p", "720p", "480p", "360p"],
             variable=self.quality_var,
             height=30,
-            font=ctk.CTkFont(size=11),
-            dropdown_font=ctk.CTkFont(size=10)
+            font=self._font(11),
+            dropdown_font=self._font(10)
         )
         quality_menu.pack(fill="x", padx=12, pady=(0, 12))
         
@@ -465,7 +600,7 @@ class StreamScribeOptimizedGUI:
         output_label = ctk.CTkLabel(
             output_frame, 
             text="📂 İndirme Klasörü:", 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font(12, "bold")
         )
         output_label.pack(anchor="w", padx=12, pady=(12, 8))
         
@@ -475,7 +610,7 @@ class StreamScribeOptimizedGUI:
         self.output_label = ctk.CTkLabel(
             dir_frame,
             text=self.output_dir,
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             anchor="w",
             wraplength=300
         )
@@ -491,7 +626,7 @@ class StreamScribeOptimizedGUI:
             width=80,
             height=28,
             command=self._browse_output_dir,
-            font=ctk.CTkFont(size=10)
+            font=self._font(10)
         )
         browse_btn.pack(side="left", padx=(5, 0))
         
@@ -501,7 +636,7 @@ class StreamScribeOptimizedGUI:
             width=60,
             height=28,
             command=self._open_output_dir,
-            font=ctk.CTkFont(size=10)
+            font=self._font(10)
         )
         open_btn.pack(side="left", padx=(5, 0))
         
@@ -512,7 +647,7 @@ class StreamScribeOptimizedGUI:
         progress_label = ctk.CTkLabel(
             progress_frame, 
             text="İndirme İlerlemesi:", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold")
         )
         progress_label.pack(anchor="w", padx=15, pady=(15, 8))
         
@@ -528,7 +663,7 @@ class StreamScribeOptimizedGUI:
         self.progress_percent = ctk.CTkLabel(
             progress_container,
             text="0%",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=self._font(11, "bold"),
             text_color=("#2b9348", "#2d5016")
         )
         self.progress_percent.pack(anchor="e", pady=(5, 0))
@@ -537,7 +672,7 @@ class StreamScribeOptimizedGUI:
         self.status_label = ctk.CTkLabel(
             progress_frame,
             text="Hazır",
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             anchor="w"
         )
         self.status_label.pack(fill="x", padx=15, pady=(0, 10))
@@ -547,7 +682,7 @@ class StreamScribeOptimizedGUI:
             progress_frame,
             text="⬇️ İNDİR",
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
             command=self._start_download,
             fg_color=("#2b9348", "#2d5016"),
             hover_color=("#1e6b32", "#1f3a0f"),
@@ -565,7 +700,7 @@ class StreamScribeOptimizedGUI:
         self.info_title = ctk.CTkLabel(
             info_header,
             text="📋 Video Bilgileri",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold")
         )
         self.info_title.pack(pady=12)
         
@@ -588,7 +723,7 @@ class StreamScribeOptimizedGUI:
         self.video_title = ctk.CTkLabel(
             self.info_frame,
             text="Video başlığı burada görünecek",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
             wraplength=350,
             anchor="center",
             justify="center"
@@ -599,7 +734,7 @@ class StreamScribeOptimizedGUI:
         self.info_details = ctk.CTkTextbox(
             self.info_frame,
             height=100,
-            font=ctk.CTkFont(size=10)
+            font=self._font(10)
         )
         self.info_details.pack(fill="x", pady=8)
         self.info_details.insert("1.0", "Video analiz edilmedi.\n\nBir YouTube URL'si girin ve 'Analiz Et' butonuna tıklayın.")
@@ -612,21 +747,63 @@ class StreamScribeOptimizedGUI:
         playlist_label = ctk.CTkLabel(
             self.playlist_frame,
             text="📋 Playlist Videoları:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold")
         )
         playlist_label.pack(anchor="w", padx=18, pady=(18, 10))
         
-        # Scrollable playlist with increased height and better spacing
-        self.playlist_listbox = ctk.CTkScrollableFrame(
-            self.playlist_frame,
-            height=200,  # Increased from 120 to 200
-            fg_color="transparent"
-        )
-        self.playlist_listbox.pack(fill="both", expand=True, padx=18, pady=(0, 18))
+        # One Treeview holds every playlist row (Tk only draws the visible ones);
+        # per-video state lives in playlist_download_status rather than in per-row widgets
+        self.playlist_tree = self._create_playlist_tree(self.playlist_frame)
         
         # Initially hide playlist frame
         self.playlist_frame.pack_forget()
     
+    def _create_playlist_tree(self, parent) -> ttk.Treeview:
+        """Create the playlist Treeview with its scrollbar and row styles"""
+        container = ctk.CTkFrame(parent, fg_color="transparent")
+        container.pack(fill="both", expand=True, padx=18, pady=(0, 18))
+        
+        dark = ctk.get_appearance_mode() == "Dark"
+        background = "#2b2b2b" if dark else "#f0f0f0"
+        foreground = "#ffffff" if dark else "#1a1a1a"
+        style = ttk.Style(self.root)
+        style.configure(
+            "Playlist.Treeview",
+            background=background,
+            fieldbackground=background,
+            foreground=foreground,
+            rowheight=28,
+            borderwidth=0,
+            font=self._font(11)
+        )
+        style.configure("Playlist.Treeview.Heading", font=self._font(10, "bold"))
+        
+        tree = ttk.Treeview(
+            container,
+            columns=("status", "title", "progress"),
+            show="headings",
+            height=7,
+            selectmode="browse",
+            style="Playlist.Treeview"
+        )
+        tree.heading("status", text="")
+        tree.heading("title", text="Video (indirmek için çift tıklayın)", anchor="w")
+        tree.heading("progress", text="")
+        tree.column("status", width=36, minwidth=36, stretch=False, anchor="center")
+        tree.column("title", width=280, anchor="w")
+        tree.column("progress", width=60, minwidth=60, stretch=False, anchor="center")
+        
+        for tag, color in self.PLAYLIST_TAG_COLORS.items():
+            tree.tag_configure(tag, foreground=color)
+        
+        scrollbar = ttk.Scrollbar(container, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+        
+        tree.bind("<Double-1>", self._on_playlist_row_activate)
+        return tree
+    
     def _setup_downloader(self):
         """Initialize downloader with callbacks"""
         try:
@@ -640,9 +817,26 @@ class StreamScribeOptimizedGUI:
             messagebox.showerror("Hata", f"Downloader başlatılamadı: {e}")
     
     def _on_url_change(self, event=None):
-        """Handle URL entry changes"""
+        """Handle URL entry changes, validating once typing pauses"""
+        if self._url_check_after:
+            self.root.after_cancel(self._url_check_after)
+        self._url_check_after = self.root.after(config.URL_CHECK_DELAY_MS, self._do_url_check)
+    
+    def _do_url_check(self):
+        """Validate the URL entry and update the action buttons"""
+        self._url_check_after = None
         url = self.url_entry.get().strip()
-        if url and ("youtube.com" in url or "youtu.be" in url):
+        if url == self._last_url:
+            return
+        self._last_url = url
+        
+        # Only touch the buttons when validity actually flips
+        valid = bool(_URL_RE.match(url))
+        if valid == self._url_valid:
+            return
+        self._url_valid = valid
+        
+        if valid:
             self.analyze_btn.configure(state="normal")
         else:
             self.analyze_btn.configure(state="disabled")
@@ -650,7 +844,7 @@ class StreamScribeOptimizedGUI:
     
     def _on_paste(self, event=None):
         """Handle paste event"""
-        self.root.after(100, self._on_url_change)
+        self._on_url_change()
     
     def _analyze_video(self):
         """Analyze video and show info"""
@@ -659,8 +853,14 @@ class StreamScribeOptimizedGUI:
             messagebox.showerror("Hata", "Lütfen bir YouTube URL'si girin!")
             return
         
+        # Re-analyzing a known URL needs no network round trip
+        cached_info = self._video_info_cache.get(url)
+        if cached_info is not None:
+            self._display_video_info(cached_info)
+            return
+        
         # Reset progress bar and status for new analysis (but preserve if bulk download is active)
-        if not hasattr(self, 'bulk_download_active') or not self.bulk_download_active:
+        if not self.bulk_download_active:
             self.progress_bar.set(0)
             self.progress_percent.configure(text="0%")
         self.status_label.configure(text="Video bilgileri alınıyor...")
@@ -670,16 +870,24 @@ class StreamScribeOptimizedGUI:
         def analyze_worker():
             try:
                 info = self.downloader.get_video_info_fast(url)
-                self.root.after(0, lambda: self._display_video_info(info))
+                self.root.after(0, functools.partial(self._on_video_analyzed, url, info))
             except Exception as e:
                 logger.error(f"Video analysis error: {e}")
-                self.root.after(0, lambda: self._show_error(f"Analiz hatası: {str(e)}"))
+                self.root.after(0, functools.partial(self._show_error, f"Analiz hatası: {str(e)}"))
             finally:
-                self.root.after(0, lambda: self.analyze_btn.configure(
-                    state="normal", text="🔍 Analiz Et"
+                self.root.after(0, functools.partial(
+                    self.analyze_btn.configure, state="normal", text="🔍 Analiz Et"
                 ))
         
-        threading.Thread(target=analyze_worker, daemon=True).start()
+        self._io_pool.submit(analyze_worker)
+    
+    def _on_video_analyzed(self, url: str, info: Dict[str, Any]):
+        """Remember a successful analysis and display it (Tk thread)"""
+        if 'error' not in info:
+            self._video_info_cache[url] = info
+            if len(self._video_info_cache) > config.CACHE_SIZE:
+                del self._video_info_cache[next(iter(self._video_info_cache))]
+        self._display_video_info(info)
     
     def _display_video_info(self, info: Dict[str, Any]):
         """Display video information in info panel"""
@@ -695,28 +903,28 @@ class StreamScribeOptimizedGUI:
         self.info_details.configure(state="normal")
         self.info_details.delete("1.0", "end")
         
-        details = f"📺 Başlık: {title}\n\n"
-        details += f"🔗 Video ID: {info.get('video_id', 'N/A')}\n\n"
-        details += f"📋 Tür: {'Playlist' if info.get('is_playlist', False) else 'Tek Video'}\n\n"
-        details += f"⚡ Yöntem: {info.get('method', 'yt-dlp').title()}\n\n"
+        is_playlist = info.get('is_playlist', False)
+        count = info.get('playlist_count', 0)
+        details = _DETAILS_TEMPLATE.format(
+            title=title,
+            video_id=info.get('video_id', 'N/A'),
+            kind='Playlist' if is_playlist else 'Tek Video',
+            method=info.get('method', 'yt-dlp').title(),
+            summary=_PLAYLIST_SUMMARY.format(count=count) if is_playlist else _VIDEO_SUMMARY,
+        )
         
-        if info.get('is_playlist', False):
-            count = info.get('playlist_count', 0)
-            details += f"📊 Video Sayısı: {count}\n\n"
-            details += "✅ Playlist analizi tamamlandı.\nAşağıdaki listeden tek tek video indirebilirsiniz."
-            
+        if is_playlist:
             # Update title to show it's a playlist
             self.info_title.configure(text="📋 Oynatma Listesi Bilgileri")
             
             # Store playlist info for download tracking
             self.current_playlist_info = info
             self.playlist_total_videos = count
+            self._playlist_prefix = f"📋 {info.get('title', 'Playlist').split(' (')[0]} - "
             
             # Show playlist videos
             self._show_playlist_videos(info)
         else:
-            details += "✅ Video analizi tamamlandı.\nİndirme için ayarları yapın ve 'İNDİR' butonuna tıklayın."
-            
             # Update title to show it's a single video
             self.info_title.configure(text="📋 Video Bilgileri")
             
@@ -728,12 +936,17 @@ class StreamScribeOptimizedGUI:
         self.info_details.insert("1.0", details)
         self.info_details.configure(state="disabled")
         
-        # Load thumbnail
+        # Load thumbnail, preferring the 320x180 variant that already fits the panel
         if 'thumbnail' in info:
-            self._load_thumbnail(info['thumbnail'])
+            thumbnail = info['thumbnail']
+            small_thumbnail = _LARGE_THUMBNAIL_RE.sub('/mqdefault.jpg', thumbnail)
+            if small_thumbnail != thumbnail:
+                self._load_thumbnail(small_thumbnail, thumbnail)
+            else:
+                self._load_thumbnail(thumbnail, info.get('fallback_thumbnail'))
         
         # Enable download button and set dynamic text based on content type
-        if info.get('is_playlist', False):
+        if is_playlist:
             # For playlists, change button text to "Tüm Playlist'i İndir"
             self.download_btn.configure(state="normal", text="🚀 Tüm Playlist'i İndir")
             # Change button command to bulk download
@@ -748,47 +961,128 @@ class StreamScribeOptimizedGUI:
         
         pass
     
-    def _load_thumbnail(self, url: str):
-        """Load and display thumbnail with caching"""
+    def _load_thumbnail(self, url: str, fallback_url: Optional[str] = None):
+        """Load and display thumbnail with caching, retrying with fallback_url on failure"""
         if not url:
+            if fallback_url:
+                self._load_thumbnail(fallback_url)
             return
         
         # Check cache first
-        if url in self._thumbnail_cache:
-            self.thumbnail_label.configure(image=self._thumbnail_cache[url], text="")
+        cached = self._thumbnail_cache.get(url)
+        if cached is not None:
+            self._thumbnail_cache.move_to_end(url)
+            self.thumbnail_label.configure(image=cached, text="")
             return
         
+        with self._thumbnail_lock:
+            if url in self._thumbnails_inflight:
+                return
+            self._thumbnails_inflight.add(url)
+        
         def load_worker():
             try:
-                response = requests.get(url, timeout=config.TIMEOUT_FAST)
-                if response.status_code == 200:
-                    image = Image.open(BytesIO(response.content))
-                    image = image.resize((350, 200), Image.Resampling.LANCZOS)
-                    
-                    ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=(350, 200))
-                    
-                    # Cache the image
-                    self._thumbnail_cache[url] = ctk_image
-                    
-                    # Limit cache size
-                    if len(self._thumbnail_cache) > config.THUMBNAIL_CACHE_SIZE:
-                        oldest_key = next(iter(self._thumbnail_cache))
-                        del self._thumbnail_cache[oldest_key]
-                    
-                    self.root.after(0, lambda: self.thumbnail_label.configure(
-                        image=ctk_image, text=""
-                    ))
+                image = self._read_cached_thumbnail(url)
+                if image is None:
+                    with self._http.get(url, timeout=config.TIMEOUT_FAST, stream=True) as response:
+                        if response.status_code == 200:
+                            # Decode straight from the socket instead of buffering the body first
+                            response.raw.decode_content = True
+                            image = _decode_thumbnail(response.raw)
+                    if image is not None:
+                        self._write_cached_thumbnail(url, image)
+                
+                if image is not None:
+                    # Tk image objects must only be created on the Tk thread
+                    self.root.after(0, functools.partial(self._apply_thumbnail, url, image))
+                    return
                     
             except Exception as e:
-                pass
+                logger.debug("Thumbnail load failed for %s: %s", url, e)
+            finally:
+                with self._thumbnail_lock:
+                    self._thumbnails_inflight.discard(url)
+            
+            # Predicted thumbnail is missing (e.g. no maxres variant) - use the fallback
+            if fallback_url and fallback_url != url:
+                self.root.after(0, functools.partial(self._load_thumbnail, fallback_url))
+        
+        self._io_pool.submit(load_worker)
+    
+    def _apply_thumbnail(self, url: str, image: Image.Image):
+        """Wrap a decoded thumbnail for display, cache it and show it (Tk thread only)"""
+        # CTkImage falls back to the light image in dark mode, so one reference is enough
+        ctk_image = ctk.CTkImage(light_image=image, size=config.THUMBNAIL_SIZE)
+        
+        # Cache the image, evicting the least recently used
+        self._thumbnail_cache[url] = ctk_image
+        if len(self._thumbnail_cache) > config.THUMBNAIL_CACHE_SIZE:
+            self._thumbnail_cache.popitem(last=False)
         
-        threading.Thread(target=load_worker, daemon=True).start()
+        self.thumbnail_label.configure(image=ctk_image, text="")
+    
+    def _thumbnail_cache_path(self, url: str) -> Path:
+        """Disk cache location for a thumbnail URL"""
+        return self._thumbnail_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.png"
+    
+    def _read_cached_thumbnail(self, url: str) -> Optional[Image.Image]:
+        """Load an already resized thumbnail from the disk cache"""
+        path = self._thumbnail_cache_path(url)
+        if not path.is_file():
+            return None
+        try:
+            image = Image.open(path)
+            image.load()
+            # Refresh mtime so eviction drops the least recently used files
+            os.utime(path)
+            return image
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cached thumbnail {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+    
+    def _write_cached_thumbnail(self, url: str, image: Image.Image):
+        """Store a resized thumbnail in the disk cache"""
+        path = self._thumbnail_cache_path(url)
+        try:
+            # Write to a temp file first so a crash never leaves a truncated PNG behind
+            tmp_path = path.with_suffix('.tmp')
+            image.save(tmp_path, "PNG", optimize=True)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not cache thumbnail {path}: {e}")
+            return
+        self._prune_thumbnail_cache()
+    
+    def _prune_thumbnail_cache(self):
+        """Evict the least recently used thumbnails beyond THUMBNAIL_DISK_CACHE_MAX"""
+        try:
+            entries = list(os.scandir(self._thumbnail_dir))
+        except OSError:
+            return
+        excess = len(entries) - config.THUMBNAIL_DISK_CACHE_MAX
+        if excess <= 0:
+            return
+        
+        aged = []
+        for entry in entries:
+            try:
+                aged.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue  # Removed by another worker meanwhile
+        aged.sort()
+        for _, path in aged[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
     
     def _show_playlist_videos(self, info: Dict[str, Any]):
         """Show playlist videos in the list"""
-        # Clear existing playlist items
-        for widget in self.playlist_listbox.winfo_children():
-            widget.destroy()
+        # Hide existing rows (kept for reuse); results of older loads are ignored
+        self._playlist_load_generation += 1
+        generation = self._playlist_load_generation
+        self.playlist_tree.detach(*self.playlist_tree.get_children())
         
         # Show playlist frame
         self.playlist_frame.pack(fill="both", expand=True, pady=8)
@@ -802,109 +1096,62 @@ class StreamScribeOptimizedGUI:
             try:
                 entries = self.downloader.get_playlist_entries(playlist_url)
                 
-                self.root.after(0, lambda: self._populate_playlist_list(entries))
+                self.root.after(0, functools.partial(self._populate_playlist_list, entries, generation))
                 
             except Exception as e:
                 logger.error(f"Playlist loading error: {e}")
-                self.root.after(0, lambda: self._show_error(f"Playlist yükleme hatası: {str(e)}"))
+                # Clear the previous playlist so nothing acts on its stale entries
+                self.root.after(0, functools.partial(self._populate_playlist_list, [], generation))
+                self.root.after(0, functools.partial(self._show_error, f"Playlist yükleme hatası: {str(e)}"))
         
-        threading.Thread(target=load_playlist_worker, daemon=True).start()
+        self._io_pool.submit(load_playlist_worker)
     
-    def _populate_playlist_list(self, entries: list):
+    def _populate_playlist_list(self, entries: list, generation: Optional[int] = None):
         """Populate the playlist list with video entries"""
+        if generation is not None and generation != self._playlist_load_generation:
+            return  # A newer playlist replaced this one
+        
+        self.playlist_tree.detach(*self.playlist_tree.get_children())
+        
+        # Replace the previous playlist even when this one has no entries,
+        # so bulk download and row activation never see stale indices
+        self.playlist_entries = entries or []
+        self.playlist_download_status = {}
+        
         if not entries:
-            no_videos_label = ctk.CTkLabel(
-                self.playlist_listbox,
-                text="❌ Playlist videoları yüklenemedi",
-                font=ctk.CTkFont(size=10),
-                text_color=("#ff6b6b", "#ff6b6b")
-            )
-            no_videos_label.pack(pady=5)
+            self._set_playlist_row("notice", 0, ("", "❌ Playlist videoları yüklenemedi", ""), "failed")
             return
         
-        # Store playlist entries for tracking
-        self.playlist_entries = entries[:20]  # Limit to first 20 videos
-        self.playlist_download_status = {}  # Track download status for each video
-        
-        for i, entry in enumerate(self.playlist_entries):
-            # Create a more structured video frame
-            video_frame = ctk.CTkFrame(self.playlist_listbox, fg_color=("#f0f0f0", "#2b2b2b"))
-            video_frame.pack(fill="x", padx=5, pady=3)
-            
-            # Video info
+        for i, entry in enumerate(entries):
             title = entry.get('title', f'Video {i+1}')
-            video_id = entry.get('id', '')
-            url = entry.get('url', '')
-            
-            # Truncate long titles with better display
-            display_title = title[:65] + "..." if len(title) > 65 else title
-            
-            # Create a horizontal layout container
-            content_frame = ctk.CTkFrame(video_frame, fg_color="transparent")
-            content_frame.pack(fill="x", padx=8, pady=5)
-            
-            # Status indicator (initially hidden)
-            status_label = ctk.CTkLabel(
-                content_frame,
-                text="⏳",
-                font=ctk.CTkFont(size=14),
-                text_color=("#ffa500", "#ffa500"),  # Orange for pending
-                width=20
-            )
-            status_label.pack(side="left", padx=(5, 8), pady=5)
-            
-            # Video title label with better formatting and more space
-            title_label = ctk.CTkLabel(
-                content_frame,
-                text=f"{i+1:2d}. {display_title}",
-                font=ctk.CTkFont(size=11),
-                anchor="center",
-                justify="center"
-            )
-            title_label.pack(side="left", fill="x", expand=True, padx=(0, 8), pady=5)
-            
-            # Progress label (initially hidden)
-            progress_label = ctk.CTkLabel(
-                content_frame,
-                text="",
-                font=ctk.CTkFont(size=10),
-                text_color=("#888888", "#888888"),
-                width=60
-            )
-            progress_label.pack(side="right", padx=(8, 5), pady=5)
-            
-            # Download button for this video with better styling
-            download_btn = ctk.CTkButton(
-                content_frame,
-                text="⬇️",
-                width=35,
-                height=28,
-                font=ctk.CTkFont(size=12),
-                command=lambda u=url, t=title, idx=i+1: self._download_playlist_video(u, t, idx)
-            )
-            download_btn.pack(side="right", padx=(8, 10), pady=5)
-            
-            # Store references for status updates
             self.playlist_download_status[i] = {
-                'frame': video_frame,
-                'status_label': status_label,
-                'progress_label': progress_label,
-                'download_btn': download_btn,
                 'title': title,
-                'url': url,
+                'url': entry.get('url', ''),
                 'index': i+1
             }
-        
-        # Bulk download button removed - now handled by dynamic main button
-        
-        if len(entries) > 20:
-            more_label = ctk.CTkLabel(
-                self.playlist_listbox,
-                text=f"📋 ... ve {len(entries) - 20} video daha",
-                font=ctk.CTkFont(size=10),
-                text_color=("#888888", "#888888")
-            )
-            more_label.pack(pady=8)
+            
+            # Truncate long titles with better display
+            display_title = title[:65] + "..." if len(title) > 65 else title
+            self._set_playlist_row(str(i), i, ("⏳", f"{i+1:2d}. {display_title}", ""), "pending")
+    
+    def _set_playlist_row(self, iid: str, position: int, values: tuple, tag: str):
+        """Show a playlist row, reusing a previously created (detached) item if there is one"""
+        tree = self.playlist_tree
+        if tree.exists(iid):
+            tree.item(iid, values=values, tags=(tag,))
+            tree.move(iid, "", position)
+        else:
+            tree.insert("", position, iid=iid, values=values, tags=(tag,))
+    
+    def _on_playlist_row_activate(self, event):
+        """Download the double-clicked playlist video"""
+        row = self.playlist_tree.identify_row(event.y)
+        if not row.isdigit():
+            return
+        video_status = self.playlist_download_status.get(int(row))
+        if not video_status or video_status.get('status') in ("downloading", "completed"):
+            return  # Placeholder row, or already queued/finished (failed rows can be retried)
+        self._download_playlist_video(video_status['url'], video_status['title'], video_status['index'])
     
     def _download_single_video(self, url: str, title: str):
         """Download a single video from playlist"""
@@ -930,19 +1177,10 @@ class StreamScribeOptimizedGUI:
             self._show_error("Geçersiz video URL'si")
             return
         
-        # Update progress tracking
-        self.playlist_download_index = video_index
-        
-        # Update status with playlist info
+        # Status with playlist info, shown once the download actually starts
         playlist_title = self.current_playlist_info.get('title', 'Playlist') if self.current_playlist_info else 'Playlist'
         playlist_name = playlist_title.split(' (')[0]  # Remove video count from title
         status_text = f"{playlist_name} - {video_index}/{self.playlist_total_videos} videosu indiriliyor"
-        self.status_label.configure(text=status_text)
-        
-        # Reset progress bar
-        self.progress_bar.set(0)
-        self.progress_percent.configure(text="0%")
-        self.download_start_time = time.time()
         
         # Get options
         audio_only = self.format_var.get() == "audio"
@@ -951,48 +1189,54 @@ class StreamScribeOptimizedGUI:
         # Create playlist-specific output directory
         playlist_output_dir = self._get_playlist_output_dir(playlist_name)
         
+        # The row shows the video as taken, so another double-click does not queue it again
+        row_index = video_index - 1
+        self._update_playlist_video_status(row_index, "downloading", "Sırada")
+        
         def download_worker():
+            # Queued behind earlier downloads; take over the shared progress display only now
+            self.playlist_download_index = video_index
+            self.download_start_time = time.monotonic()
+            self.root.after(0, functools.partial(self._update_playlist_video_status, row_index, "downloading", "⬇️"))
+            self.root.after(0, functools.partial(self._apply_progress, 0.0, "0%", status_text))
+            
             try:
-                # Temporarily update downloader output directory
-                original_output_dir = self.downloader.output_dir
-                self.downloader.output_dir = playlist_output_dir
-                
                 success = self.downloader.download(
                     url=url,
                     audio_only=audio_only,
                     max_height=max_height,
                     prefer_mp4=True,
                     no_playlist=True,
-                    include_subs=False
+                    include_subs=False,
+                    output_dir=playlist_output_dir
                 )
                 
-                # Restore original output directory
-                self.downloader.output_dir = original_output_dir
-                
                 if success:
-                    self.root.after(0, lambda: self.progress_bar.set(1.0))
-                    self.root.after(0, lambda: self.progress_percent.configure(text="100%"))
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text=f"✅ {playlist_name} - {video_index}/{self.playlist_total_videos} videosu tamamlandı"
+                    self.root.after(0, functools.partial(
+                        self._apply_progress, 1.0, "100%",
+                        f"✅ {playlist_name} - {video_index}/{self.playlist_total_videos} videosu tamamlandı",
+                        video_idx=row_index, video_status="completed"
                     ))
-                    pass
                 else:
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text=f"❌ {playlist_name} - {video_index}/{self.playlist_total_videos} videosu başarısız"
+                    self.root.after(0, functools.partial(
+                        self._apply_progress,
+                        status_text=f"❌ {playlist_name} - {video_index}/{self.playlist_total_videos} videosu başarısız",
+                        video_idx=row_index, video_status="failed"
                     ))
                     logger.error(f"Playlist video download failed: {title}")
                     
             except Exception as e:
                 logger.error(f"Playlist video download error: {e}")
-                self.root.after(0, lambda: self.status_label.configure(
-                    text=f"❌ Hata: {str(e)[:50]}..."
+                self.root.after(0, functools.partial(
+                    self._apply_progress, status_text=f"❌ Hata: {str(e)[:50]}...",
+                    video_idx=row_index, video_status="failed"
                 ))
         
-        threading.Thread(target=download_worker, daemon=True).start()
+        self._download_queue.put(download_worker)
     
     def _start_bulk_download(self):
         """Start bulk download of all playlist videos"""
-        if not hasattr(self, 'playlist_entries') or not self.playlist_entries:
+        if not self.playlist_entries:
             self._show_error("Playlist videoları bulunamadı!")
             return
         
@@ -1015,16 +1259,12 @@ class StreamScribeOptimizedGUI:
             return
         
         # Get playlist output directory
-        playlist_output_dir = self._get_playlist_output_dir(playlist_name)
-        
-        # Verify directory was created
-        if not os.path.exists(playlist_output_dir):
-            logger.error(f"Failed to create playlist directory: {playlist_output_dir}")
-            self._show_error(f"Playlist klasörü oluşturulamadı: {playlist_output_dir}")
+        try:
+            playlist_output_dir = self._get_playlist_output_dir(playlist_name)
+        except OSError as e:
+            self._show_error(f"Playlist klasörü oluşturulamadı: {e}")
             return
         
-        pass
-        
         # Store playlist output directory for use in download functions
         self.current_playlist_output_dir = playlist_output_dir
         
@@ -1044,113 +1284,102 @@ class StreamScribeOptimizedGUI:
         folder_name = os.path.basename(playlist_output_dir)
         self.status_label.configure(text=f"🚀 {playlist_name} - Toplu indirme başlatılıyor...\n📁 Klasör: {folder_name}")
         
-        # Start first video download
-        self._download_next_playlist_video()
-    
-    def _download_next_playlist_video(self):
-        """Download next video in playlist sequence"""
-        if not self.bulk_download_active or self.bulk_download_index >= self.bulk_download_total:
-            self._finish_bulk_download()
-            return
-        
-        # Get current video info
-        current_video = self.playlist_entries[self.bulk_download_index]
-        url = current_video.get('url', '')
-        title = current_video.get('title', f'Video {self.bulk_download_index + 1}')
-        
-        # Update status for current video
-        playlist_title = self.current_playlist_info.get('title', 'Playlist') if self.current_playlist_info else 'Playlist'
-        playlist_name = playlist_title.split(' (')[0]
-        
-        # Calculate current progress percentage for bulk download
-        current_progress = int(((self.bulk_download_index + 1) / self.bulk_download_total) * 100)
-        status_text = f"🚀 {playlist_name} - [{self.bulk_download_index + 1}/{self.bulk_download_total}] videosu indiriliyor | 📊 Progress: {current_progress}%"
-        self.status_label.configure(text=status_text)
-        
-        # Update video status in playlist
-        self._update_playlist_video_status(self.bulk_download_index, "downloading", "0%")
-        
         # Get options
         audio_only = self.format_var.get() == "audio"
         max_height = config.get_quality_value(self.quality_var.get())
         
-        # Use the playlist output directory created in _start_bulk_download
-        playlist_output_dir = getattr(self, 'current_playlist_output_dir', None)
-        if not playlist_output_dir:
-            logger.error("Playlist output directory not found!")
-            self._show_error("Playlist klasörü bulunamadı!")
-            return
-        
-        def download_worker():
+        # Download several videos at once; a coordinator reports completions in order
+        self._bulk_pool = DaemonThreadPoolExecutor(
+            max_workers=min(config.BULK_DOWNLOAD_WORKERS, self.bulk_download_total),
+            thread_name_prefix="bulk"
+        )
+        # Every row is taken by the bulk run, so double-clicks cannot queue a second download
+        for i in range(self.bulk_download_total):
+            self._update_playlist_video_status(i, "downloading", "Sırada")
+        futures = {
+            self._bulk_pool.submit(
+                self._download_bulk_entry, i, entry, audio_only, max_height, playlist_output_dir
+            ): i
+            for i, entry in enumerate(self.playlist_entries)
+        }
+        self._io_pool.submit(self._coordinate_bulk_download, futures)
+    
+    def _download_bulk_entry(self, index: int, entry: Dict[str, Any],
+                             audio_only: bool, max_height: int, output_dir: str) -> bool:
+        """Download one playlist video on a bulk pool thread"""
+        self.root.after(0, functools.partial(self._update_playlist_video_status, index, "downloading", "0%"))
+        
+        # Each video reports to its own row; the overall bar and status line
+        # belong to _on_bulk_video_done
+        success = self.downloader.download(
+            url=entry.get('url', ''),
+            audio_only=audio_only,
+            max_height=max_height,
+            prefer_mp4=True,
+            no_playlist=True,
+            include_subs=False,
+            output_dir=output_dir,
+            progress_callback=functools.partial(self._bulk_row_progress, index),
+            status_callback=self._bulk_status_callback
+        )
+        if not success:
+            logger.error(f"Bulk download video failed: {entry.get('title', f'Video {index + 1}')}")
+        return success
+    
+    def _bulk_row_progress(self, index: int, data: Dict[str, Any]):
+        """Record one bulk video's progress for its row (called from bulk pool threads)"""
+        if data.get('status') == 'downloading':
+            total = data.get('total_bytes') or 0
+            percent = min(100, int((data.get('downloaded_bytes') or 0) * 100 / total)) if total else 0
+            text = f"{percent}%"
+        else:
+            text = "100%"
+        with self._progress_lock:
+            self._pending_rows[index] = text
+    
+    def _bulk_status_callback(self, message: str):
+        """Drop per-video status messages; the bulk status line is set per finished video"""
+        logger.debug("Bulk download status: %s", message)
+    
+    def _coordinate_bulk_download(self, futures: Dict[Any, int]):
+        """Forward bulk download completions to the Tk thread as they finish"""
+        for future in as_completed(futures):
+            if self._closing:
+                return
+            index = futures[future]
             try:
-                # Temporarily update downloader output directory
-                original_output_dir = self.downloader.output_dir
-                self.downloader.output_dir = playlist_output_dir
-                
-                success = self.downloader.download(
-                    url=url,
-                    audio_only=audio_only,
-                    max_height=max_height,
-                    prefer_mp4=True,
-                    no_playlist=True,
-                    include_subs=False
-                )
-                
-                # Restore original output directory
-                self.downloader.output_dir = original_output_dir
-                
-                if success:
-                    # Update video status to completed
-                    self.root.after(0, lambda: self._update_playlist_video_status(
-                        self.bulk_download_index, "completed", "100%"
-                    ))
-                    
-                    # Update overall progress - each video adds 1/total to progress
-                    # For 10 videos: 1st video = 10%, 2nd video = 20%, ..., 10th video = 100%
-                    progress = (self.bulk_download_index + 1) / self.bulk_download_total
-                    
-                    # Ensure progress is between 0 and 1
-                    progress = max(0.0, min(1.0, progress))
-                    
-                    # Update progress bar (0.0 to 1.0) - BULK DOWNLOAD PROGRESS
-                    self.root.after(0, lambda: self.progress_bar.set(progress))
-                    
-                    # Update percentage text (0% to 100%) - BULK DOWNLOAD PERCENTAGE
-                    percentage = int(progress * 100)
-                    self.root.after(0, lambda: self.progress_percent.configure(
-                        text=f"📋 Playlist[{self.bulk_download_index + 1}/{self.bulk_download_total}] {percentage}%"
-                    ))
-                    
-                    pass
-                else:
-                    # Update video status to failed
-                    self.root.after(0, lambda: self._update_playlist_video_status(
-                        self.bulk_download_index, "failed", "❌"
-                    ))
-                    
-                    logger.error(f"Bulk download video failed: {title}")
-                
-                # Move to next video
-                self.bulk_download_index += 1
-                
-                # Download next video after a short delay
-                self.root.after(1000, self._download_next_playlist_video)
-                    
+                success = future.result()
             except Exception as e:
                 logger.error(f"Bulk download error: {e}")
-                self.root.after(0, lambda: self._update_playlist_video_status(
-                    self.bulk_download_index, "failed", "❌"
-                ))
-                
-                # Move to next video even if failed
-                self.bulk_download_index += 1
-                self.root.after(1000, self._download_next_playlist_video)
+                success = False
+            self.root.after(0, functools.partial(self._on_bulk_video_done, index, success))
         
-        threading.Thread(target=download_worker, daemon=True).start()
+        self.root.after(0, self._finish_bulk_download)
+    
+    def _on_bulk_video_done(self, index: int, success: bool):
+        """Record one finished bulk video and advance the overall progress"""
+        self.bulk_download_index += 1
+        done = self.bulk_download_index
+        
+        # Each finished video adds 1/total to the overall progress
+        progress = max(0.0, min(1.0, done / self.bulk_download_total))
+        percentage = int(progress * 100)
+        
+        playlist_title = self.current_playlist_info.get('title', 'Playlist') if self.current_playlist_info else 'Playlist'
+        playlist_name = playlist_title.split(' (')[0]
+        
+        self._apply_progress(
+            progress,
+            f"📋 Playlist[{done}/{self.bulk_download_total}] {percentage}%",
+            f"🚀 {playlist_name} - [{done}/{self.bulk_download_total}] video tamamlandı | 📊 Progress: {percentage}%",
+            video_idx=index,
+            video_status="completed" if success else "failed"
+        )
     
     def _finish_bulk_download(self):
         """Finish bulk download process"""
         self.bulk_download_active = False
+        self._bulk_pool.shutdown(wait=False)
         
         # Update final status
         playlist_title = self.current_playlist_info.get('title', 'Playlist') if self.current_playlist_info else 'Playlist'
@@ -1160,7 +1389,7 @@ class StreamScribeOptimizedGUI:
                             if status.get('status') == 'completed')
         
         # Use the playlist output directory created in _start_bulk_download
-        playlist_output_dir = getattr(self, 'current_playlist_output_dir', None)
+        playlist_output_dir = self.current_playlist_output_dir
         if not playlist_output_dir:
             logger.error("Playlist output directory not found in finish!")
             return
@@ -1171,8 +1400,8 @@ class StreamScribeOptimizedGUI:
             self.progress_bar.set(1.0)
             self.progress_percent.configure(text="📋 Playlist[10/10] 100% (Tüm videolar tamamlandı)")
             
-            # Ask user if they want to open the folder
-            self.root.after(1000, lambda: self._ask_open_playlist_folder(playlist_output_dir, playlist_name))
+            # Offer to open the folder without blocking the event loop
+            self._show_open_folder_banner(playlist_output_dir, playlist_name)
         else:
             failed_count = self.bulk_download_total - completed_count
             final_progress = int((completed_count / self.bulk_download_total) * 100)
@@ -1184,21 +1413,46 @@ class StreamScribeOptimizedGUI:
         
         pass
     
-    def _ask_open_playlist_folder(self, folder_path: str, playlist_name: str):
-        """Ask user if they want to open the playlist folder"""
-        try:
-            result = messagebox.askyesno(
-                "Klasör Açma",
-                f"'{playlist_name}' playlist'indeki tüm videolar indirildi!\n\n"
-                f"Klasörü açmak istiyor musunuz?\n"
-                f"📁 {os.path.basename(folder_path)}"
-            )
-            
-            if result:
-                self._open_playlist_folder(folder_path)
-                
-        except Exception as e:
-            pass
+    def _show_open_folder_banner(self, folder_path: str, playlist_name: str):
+        """Offer to open the playlist folder in an inline banner instead of a modal dialog"""
+        self._dismiss_folder_banner()
+        
+        banner = ctk.CTkFrame(self.status_label.master, fg_color=("#2b9348", "#2d5016"))
+        banner.pack(fill="x", padx=15, pady=(0, 10), after=self.status_label)
+        
+        ctk.CTkLabel(
+            banner,
+            text=f"✅ '{playlist_name}' indirildi  📁 {os.path.basename(folder_path)}",
+            font=self._font(11),
+            anchor="w"
+        ).pack(side="left", fill="x", expand=True, padx=(10, 5), pady=6)
+        ctk.CTkButton(
+            banner,
+            text="✖",
+            width=28,
+            height=26,
+            font=self._font(11),
+            command=self._dismiss_folder_banner
+        ).pack(side="right", padx=(0, 8), pady=6)
+        ctk.CTkButton(
+            banner,
+            text="📂 Klasörü Aç",
+            width=110,
+            height=26,
+            font=self._font(11),
+            command=functools.partial(self._open_playlist_folder, folder_path)
+        ).pack(side="right", padx=5, pady=6)
+        
+        self._folder_banner = banner
+        self.root.after(config.NOTIFICATION_TIMEOUT_MS, functools.partial(self._dismiss_folder_banner, banner))
+    
+    def _dismiss_folder_banner(self, banner: Optional[ctk.CTkFrame] = None):
+        """Remove the open-folder banner (only if it is still the given one, when passed)"""
+        current = self._folder_banner
+        if current is None or (banner is not None and banner is not current):
+            return
+        self._folder_banner = None
+        current.destroy()
     
     def _open_playlist_folder(self, folder_path: str):
         """Open the playlist folder in file explorer"""
@@ -1218,46 +1472,37 @@ class StreamScribeOptimizedGUI:
     
     def _update_playlist_video_status(self, video_index: int, status: str, progress_text: str):
         """Update status of a specific playlist video"""
-        if video_index not in self.playlist_download_status:
+        video_status = self.playlist_download_status.get(video_index)
+        if video_status is None:
             return
         
-        video_status = self.playlist_download_status[video_index]
-        status_label = video_status['status_label']
-        progress_label = video_status['progress_label']
-        download_btn = video_status['download_btn']
-        
-        if status == "downloading":
-            status_label.configure(text="⏳", text_color=("#ffa500", "#ffa500"))  # Orange
-            progress_label.configure(text=progress_text)
-            download_btn.configure(state="disabled", text="⏳")
-            # Store status for completion tracking
-            video_status['status'] = 'downloading'
-            
-        elif status == "completed":
-            status_label.configure(text="✅", text_color=("#4CAF50", "#4CAF50"))  # Green
-            progress_label.configure(text="✅")
-            download_btn.configure(state="disabled", text="✅", fg_color=("#4CAF50", "#4CAF50"))
-            # Store status for completion tracking
-            video_status['status'] = 'completed'
-            
-        elif status == "failed":
-            status_label.configure(text="❌", text_color=("#f44336", "#f44336"))  # Red
-            progress_label.configure(text="❌")
-            download_btn.configure(state="disabled", text="❌")
-            # Store status for completion tracking
-            video_status['status'] = 'failed'
+        icon = self.PLAYLIST_STATUS_ICONS.get(status)
+        if icon is None:
+            return
+        if status != "downloading":
+            progress_text = icon
+        
+        # Store status for completion tracking
+        video_status['status'] = status
+        row = str(video_index)
+        if self.playlist_tree.exists(row):
+            self.playlist_tree.item(row, tags=(status,))
+            self.playlist_tree.set(row, "status", icon)
+            self.playlist_tree.set(row, "progress", progress_text)
     
     def _get_playlist_output_dir(self, playlist_name: str) -> str:
         """Get playlist-specific output directory with date and better naming"""
-        import re
-        from datetime import datetime
+        # Later downloads from the same playlist go to the folder created first
+        cache_key = (self.output_dir, playlist_name)
+        cached = self._playlist_dir_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Clean playlist name for folder name
-        clean_name = re.sub(r'[<>:"/\\|?*]', '_', playlist_name)
-        clean_name = clean_name.strip()[:40]  # Limit length
+        clean_name = _INVALID_FS_CHARS.sub('_', playlist_name).strip()[:40]  # Limit length
         
         # Add current date and time for better organization
-        current_datetime = datetime.now().strftime("%Y-%m-%d_%H-%M")
+        current_datetime = time.strftime("%Y-%m-%d_%H-%M")
         
         # Create folder name: PlaylistName_YYYY-MM-DD_HH-MM
         folder_name = f"{clean_name}_{current_datetime}"
@@ -1265,19 +1510,13 @@ class StreamScribeOptimizedGUI:
         playlist_dir = os.path.join(self.output_dir, folder_name)
         
         try:
-            # Create directory if it doesn't exist
+            # Create directory if it doesn't exist; raises if it cannot be created
             os.makedirs(playlist_dir, exist_ok=True)
-            
-            # Verify directory was created
-            if os.path.exists(playlist_dir):
-                pass
-            else:
-                logger.error(f"Failed to create directory: {playlist_dir}")
-                
         except Exception as e:
             logger.error(f"Error creating playlist directory: {e}")
             raise
         
+        self._playlist_dir_cache[cache_key] = playlist_dir
         return playlist_dir
     
     def _browse_output_dir(self):
@@ -1329,19 +1568,6 @@ class StreamScribeOptimizedGUI:
         # Update UI
         self.download_btn.configure(state="disabled", text="📡 İNDİRİLİYOR...")
         
-        # Only reset progress bar if not in bulk download mode
-        if not hasattr(self, 'bulk_download_active') or not self.bulk_download_active:
-            self.progress_bar.set(0)
-            self.progress_percent.configure(text="0%")
-        
-        self.status_label.configure(text="İndirme başlatılıyor...")
-        self.download_start_time = time.time()
-        
-        # Reset playlist download tracking for single video downloads
-        if not self.current_playlist_info:
-            self.playlist_download_index = 0
-            self.playlist_total_videos = 0
-        
         # If we're in a playlist context, create playlist folder for single video downloads
         playlist_output_dir = None
         if self.current_playlist_info:
@@ -1358,6 +1584,18 @@ class StreamScribeOptimizedGUI:
         max_height = config.get_quality_value(self.quality_var.get())
         
         def download_worker():
+            # Queued behind earlier downloads; take over the shared progress display only now
+            self.download_start_time = time.monotonic()
+            if not self.current_playlist_info:
+                # Reset playlist download tracking for single video downloads
+                self.playlist_download_index = 0
+                self.playlist_total_videos = 0
+            # Only reset the progress bar if not in bulk download mode
+            if self.bulk_download_active:
+                self.root.after(0, functools.partial(self._apply_progress, status_text="İndirme başlatılıyor..."))
+            else:
+                self.root.after(0, functools.partial(self._apply_progress, 0.0, "0%", "İndirme başlatılıyor..."))
+            
             try:
                 success = self.downloader.download(
                     url=url,
@@ -1365,82 +1603,76 @@ class StreamScribeOptimizedGUI:
                     max_height=max_height,
                     prefer_mp4=True,
                     no_playlist=True,
-                    include_subs=False
+                    include_subs=False,
+                    output_dir=playlist_output_dir
                 )
                 
                 if success:
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text="🎉 İndirme başarıyla tamamlandı!"
+                    self.root.after(0, functools.partial(
+                        self._apply_progress, 1.0, "100%", "🎉 İndirme başarıyla tamamlandı!"
                     ))
-                    self.root.after(0, lambda: self.progress_bar.set(1.0))
-                    self.root.after(0, lambda: self.progress_percent.configure(text="100%"))
-                    pass
                 else:
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text="❌ İndirme başarısız"
+                    self.root.after(0, functools.partial(
+                        self._apply_progress, status_text="❌ İndirme başarısız"
                     ))
                     logger.error("Download failed")
                     
             except Exception as e:
                 logger.error(f"Download error: {e}")
-                self.root.after(0, lambda: self.status_label.configure(
-                    text=f"❌ Hata: {str(e)[:50]}..."
+                self.root.after(0, functools.partial(
+                    self._apply_progress, status_text=f"❌ Hata: {str(e)[:50]}..."
                 ))
             finally:
-                self.root.after(0, lambda: self.download_btn.configure(
-                    state="normal", text="⬇️ İNDİR"
+                self.root.after(0, functools.partial(
+                    self.download_btn.configure, state="normal", text="⬇️ İNDİR"
                 ))
         
-        threading.Thread(target=download_worker, daemon=True).start()
+        self._download_queue.put(download_worker)
+    
+    def _download_loop(self):
+        """Run queued download jobs one at a time until the None sentinel arrives"""
+        while True:
+            job = self._download_queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Download worker error: {e}")
     
     def _progress_callback(self, data: Dict[str, Any]):
         """Handle download progress updates"""
-        if not hasattr(self, 'download_start_time') or not self.download_start_time:
-            self.download_start_time = time.time()
+        if not self.download_start_time:
+            self.download_start_time = time.monotonic()
         
         try:
-            if data['status'] == 'downloading':
-                # Extract percentage with multiple fallback methods
-                percent = 0.0
-                
-                # Method 1: Try _percent_str first
-                if '_percent_str' in data and data['_percent_str']:
-                    try:
-                        percent_str = data['_percent_str'].replace('%', '').strip()
-                        if percent_str and percent_str != 'N/A':
-                            percent = float(percent_str) / 100.0
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Method 2: Calculate from downloaded/total bytes
-                if percent == 0.0 and 'downloaded_bytes' in data and 'total_bytes' in data:
-                    downloaded = data.get('downloaded_bytes', 0)
-                    total = data.get('total_bytes', 0) or data.get('total_bytes_estimate', 0)
-                    if total > 0 and downloaded > 0:
-                        percent = min(downloaded / total, 1.0)
-                
-                # Method 3: Calculate from downloaded/total bytes estimate
-                if percent == 0.0 and 'downloaded_bytes' in data and 'total_bytes_estimate' in data:
-                    downloaded = data.get('downloaded_bytes', 0)
-                    total_estimate = data.get('total_bytes_estimate', 0)
-                    if total_estimate > 0 and downloaded > 0:
-                        percent = min(downloaded / total_estimate, 1.0)
-                
-                # Ensure percent is valid
-                if not isinstance(percent, (int, float)) or percent < 0:
-                    percent = 0.0
-                elif percent > 1.0:
+            status = data['status']
+            if status == 'downloading':
+                # Read every field once; byte counts are authoritative for the percent
+                get = data.get
+                downloaded_size = get('downloaded_bytes') or 0
+                # The downloader reports its per-file stabilized total as total_bytes
+                total_size = get('total_bytes') or 0
+                speed = get('speed') or 0
+                eta = get('eta') or 0
+                percent = downloaded_size / total_size if total_size else 0.0
+                if percent > 1.0:
                     percent = 1.0
+                elif percent < 0.0:
+                    percent = 0.0
+                
+                # The UI only refreshes every PROGRESS_REFRESH_MS, so skip
+                # formatting ticks that would be overwritten before then
+                now = time.monotonic()
+                if now - self._last_progress_ts < self._progress_interval and percent < 0.999:
+                    return
+                self._last_progress_ts = now
                 
-                # Update progress bar and percentage (use after_idle for better performance)
-                # But don't update if we're in bulk download mode (let bulk download handle progress)
-                if not hasattr(self, 'bulk_download_active') or not self.bulk_download_active:
-                    self.root.after_idle(lambda p=percent: self.progress_bar.set(p))
-                    self.root.after_idle(lambda p=percent: self.progress_percent.configure(text=f"{p*100:.1f}%"))
+                # Don't touch the bar in bulk download mode (let bulk download handle progress)
+                bar_percent = None if self.bulk_download_active else percent
                 
                 # Format speed
-                speed = data.get('speed', 0)
-                if isinstance(speed, (int, float)) and speed > 0:
+                if speed > 0:
                     if speed > 1024*1024:  # MB/s
                         speed_str = f"{speed/(1024*1024):.1f} MB/s"
                     elif speed > 1024:  # KB/s
@@ -1451,62 +1683,134 @@ class StreamScribeOptimizedGUI:
                     speed_str = "Hesaplanıyor..."
                 
                 # Format ETA
-                eta = data.get('eta', 0)
-                if isinstance(eta, (int, float)) and eta > 0:
-                    if eta > 60:
-                        eta_str = f"{int(eta//60)}dk {int(eta%60)}s"
-                    else:
-                        eta_str = f"{int(eta)}s"
+                if eta > 0:
+                    eta_str = _format_duration(int(eta))
                 else:
                     eta_str = "Hesaplanıyor..."
                 
                 # Calculate elapsed time
-                elapsed = time.time() - self.download_start_time
-                if elapsed > 60:
-                    elapsed_str = f"{int(elapsed//60)}dk {int(elapsed%60)}s"
-                else:
-                    elapsed_str = f"{int(elapsed)}s"
+                elapsed_str = _format_duration(int(now - self.download_start_time))
                 
                 # Format file size information
-                downloaded_size = data.get('downloaded_bytes', 0)
-                total_size = data.get('total_bytes', 0) or data.get('total_bytes_estimate', 0)
-                
                 if downloaded_size > 0 and total_size > 0:
-                    downloaded_mb = downloaded_size / (1024 * 1024)
-                    total_mb = total_size / (1024 * 1024)
-                    size_info = f"📁 {downloaded_mb:.1f}MB / {total_mb:.1f}MB"
+                    size_info = f"📁 {_format_mib(downloaded_size)} / {_format_mib(total_size)}"
                 elif downloaded_size > 0:
-                    downloaded_mb = downloaded_size / (1024 * 1024)
-                    size_info = f"📁 {downloaded_mb:.1f}MB"
+                    size_info = f"📁 {_format_mib(downloaded_size)}"
                 else:
                     size_info = "📁 Hesaplanıyor..."
                 
                 # Update status with playlist info if available
+                pct_str = format(percent * 100, '.1f')
                 if self.current_playlist_info and self.playlist_download_index > 0:
-                    playlist_title = self.current_playlist_info.get('title', 'Playlist')
-                    playlist_name = playlist_title.split(' (')[0]  # Remove video count from title
-                    status_text = f"📋 {playlist_name} - [{self.playlist_download_index}/{self.playlist_total_videos}] videosu | ⬇️ {percent*100:.1f}% | {size_info} | 🚀 {speed_str} | ⏱️ Kalan: {eta_str}"
+                    status_text = "".join((
+                        self._playlist_prefix,
+                        f"[{self.playlist_download_index}/{self.playlist_total_videos}] videosu | ⬇️ ",
+                        pct_str, "% | ", size_info, " | 🚀 ", speed_str, " | ⏱️ Kalan: ", eta_str,
+                    ))
                 else:
-                    status_text = f"⬇️ {percent*100:.1f}% | {size_info} | 🚀 {speed_str} | ⏱️ Kalan: {eta_str} | 🕑 Geçen: {elapsed_str}"
+                    status_text = "".join((
+                        "⬇️ ", pct_str, "% | ", size_info, " | 🚀 ", speed_str,
+                        " | ⏱️ Kalan: ", eta_str, " | 🕑 Geçen: ", elapsed_str,
+                    ))
                 
-                self.root.after_idle(lambda text=status_text: self.status_label.configure(text=text))
+                # Nothing visible changed since the last tick (e.g. a stalled download)
+                if status_text == self._last_status_text:
+                    return
+                self._last_status_text = status_text
                 
-            elif data['status'] == 'finished':
-                self.root.after_idle(lambda: self.progress_bar.set(1.0))
-                self.root.after_idle(lambda: self.progress_percent.configure(text="100%"))
-                pass
+                self._set_pending_progress(bar_percent, status_text)
+                
+            elif status == 'finished':
+                # One pending update covers bar and percent; bulk mode owns the bar
+                if not self.bulk_download_active:
+                    self._set_pending_progress(1.0, None)
                 
         except Exception as e:
-            logger.error(f"Progress callback error: {e}")
-            logger.error(f"Progress data: {data}")
+            # A persistent failure would repeat on every tick; log each distinct error every 5 s at most
+            signature = (type(e), str(e))
+            now = time.monotonic()
+            last_signature, last_logged = self._last_progress_error
+            if signature != last_signature or now - last_logged > 5.0:
+                self._last_progress_error = (signature, now)
+                logger.error("Progress callback error: %s", e)
+                logger.debug("Progress data: %r", data)
+    
+    def _apply_progress(self, bar_val: Optional[float] = None, pct_text: Optional[str] = None,
+                        status_text: Optional[str] = None, video_idx: Optional[int] = None,
+                        video_status: Optional[str] = None):
+        """Apply one batch of progress widget updates on the Tk thread
+        
+        Fields set here win over older pending updates (e.g. the downloader's own
+        "İndirme tamamlandı!"), which would otherwise be flushed over them later.
+        """
+        with self._progress_lock:
+            if self._pending_progress is not None:
+                pending_percent, pending_text = self._pending_progress
+                if bar_val is not None:
+                    pending_percent = None
+                if status_text is not None:
+                    pending_text = None
+                if pending_percent is None and pending_text is None:
+                    self._pending_progress = None
+                else:
+                    self._pending_progress = (pending_percent, pending_text)
+        
+        if bar_val is not None:
+            self.progress_bar.set(bar_val)
+        if pct_text is not None:
+            self.progress_percent.configure(text=pct_text)
+        if status_text is not None:
+            self.status_label.configure(text=status_text)
+        if video_idx is not None and video_status is not None:
+            self._update_playlist_video_status(video_idx, video_status, "")
+    
+    def _set_pending_progress(self, percent: Optional[float], status_text: Optional[str]):
+        """Record the latest progress for the next UI refresh (called from download threads)
+        
+        None keeps whatever the not-yet-applied update had for that field.
+        """
+        with self._progress_lock:
+            if self._pending_progress is not None:
+                pending_percent, pending_text = self._pending_progress
+                if percent is None:
+                    percent = pending_percent
+                if status_text is None:
+                    status_text = pending_text
+            self._pending_progress = (percent, status_text)
+    
+    def _flush_progress(self):
+        """Apply the most recent pending progress on the Tk thread and reschedule"""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, None
+            rows, self._pending_rows = self._pending_rows, {}
+        
+        for index, text in rows.items():
+            # A finished row keeps the result _update_playlist_video_status gave it
+            video_status = self.playlist_download_status.get(index)
+            if video_status and video_status.get('status') == "downloading":
+                with contextlib.suppress(tk.TclError):
+                    self.playlist_tree.set(str(index), "progress", text)
+        
+        if pending is not None:
+            percent, status_text = pending
+            try:
+                if percent is not None:
+                    self.progress_bar.set(percent)
+                    self.progress_percent.configure(text=f"{percent*100:.1f}%")
+                if status_text is not None:
+                    self.status_label.configure(text=status_text)
+            except tk.TclError:
+                return  # Window is being destroyed
+        
+        self.root.after(config.PROGRESS_REFRESH_MS, self._flush_progress)
     
     def _status_callback(self, message: str):
-        """Handle status updates"""
-        self.root.after(0, lambda: self.status_label.configure(text=message))
+        """Handle status updates, applied with the next progress refresh"""
+        self._set_pending_progress(None, message)
     
     def _error_callback(self, error: str):
         """Handle errors"""
-        self.root.after(0, lambda: self._show_error(error))
+        self.root.after(0, functools.partial(self._show_error, error))
     
     def _show_error(self, error: str):
         """Show error message"""
@@ -1526,9 +1830,23 @@ class StreamScribeOptimizedGUI:
     def _cleanup(self):
         """Cleanup resources"""
         try:
+            # Running downloads abort at their next progress tick
+            self._closing = True
+            if self.downloader:
+                self.downloader.cancel()
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            if self._bulk_pool:
+                self._bulk_pool.shutdown(wait=False, cancel_futures=True)
+            
+            # Drop queued downloads and let the worker finish its cancelled one
+            # before the downloader closes its YoutubeDL instances
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    self._download_queue.get_nowait()
+            self._download_queue.put(None)
+            self._download_thread.join(timeout=config.DOWNLOAD_STOP_TIMEOUT)
             if self.downloader:
                 self.downloader.cleanup()
-            pass
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
 
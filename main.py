@@ -15,7 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import config
 from logger import setup_logging, get_logger, log_error
-from error_handler import ErrorHandler, handle_error
+from error_handler import ErrorHandler, handle_error, flush_error_log
 from utils import cleanup_resources
 
 
@@ -278,6 +278,7 @@ GUI Özellikleri:
         return 1
     finally:
         # Cleanup resources
+        flush_error_log()
         cleanup_resources()
 
 
@@ -16,9 +16,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import config
 from logger import setup_logging, get_logger
-from error_handler import ErrorHandler, NetworkError, DownloadError
+from error_handler import ErrorHandler, ErrorType, NetworkError, DownloadError, StreamScribeError
 from utils import PerformanceOptimizer, cache_result, retry_on_failure, measure_time
-from downloader import OptimizedYouTubeDownloader
+from downloader import OptimizedYouTubeDownloader, _freeze_options
 
 logger = get_logger('test')
 
@@ -61,13 +61,13 @@ class TestErrorHandler(unittest.TestCase):
     def test_network_error(self):
         """Test network error handling"""
         error = NetworkError("Connection timeout")
-        self.assertEqual(error.error_type.value, "network")
+        self.assertEqual(error.error_type, ErrorType.NETWORK)
         self.assertIn("İnternet bağlantısı", error.user_message)
     
     def test_download_error(self):
         """Test download error handling"""
         error = DownloadError("Video not found")
-        self.assertEqual(error.error_type.value, "download")
+        self.assertEqual(error.error_type, ErrorType.DOWNLOAD)
         self.assertIn("Video indirme", error.user_message)
     
     def test_error_categorization(self):
@@ -79,6 +79,130 @@ class TestErrorHandler(unittest.TestCase):
             result = self.error_handler.handle_error(e, "test_context")
             self.assertIn("İnternet bağlantısı", result)
 
+    def test_lazy_traceback(self):
+        """Test tracebacks are only captured when an exception is active"""
+        self.assertEqual(NetworkError("Connection timeout").traceback, '')
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            error = DownloadError("Video not found", e)
+        self.assertIn("ValueError: boom", error.traceback)
+    
+    def test_categorization_priority(self):
+        """Test categories keep their precedence when several keywords match"""
+        error = self.error_handler._categorize_error(Exception("Video download timeout"))
+        self.assertEqual(error.error_type, ErrorType.NETWORK)
+        error = self.error_handler._categorize_error(Exception("Invalid setting in config file"))
+        self.assertEqual(error.error_type, ErrorType.FILE)
+        error = self.error_handler._categorize_error(Exception("something odd"))
+        self.assertEqual(error.error_type, ErrorType.UNKNOWN)
+
+    def test_categorized_error_subclass(self):
+        """Test categorized errors are instances of their category's exception class"""
+        self.assertIsInstance(self.error_handler._categorize_error(ConnectionError()), NetworkError)
+        self.assertIsInstance(self.error_handler._categorize_error(Exception("Video download failed")), DownloadError)
+        error = self.error_handler._categorize_error(Exception("something odd"))
+        self.assertIs(type(error), StreamScribeError)
+        self.assertEqual(error.user_message, "something odd")
+
+    def test_builtin_exception_dispatch(self):
+        """Test built-in OS errors are categorized by type before keywords"""
+        error = self.error_handler._categorize_error(PermissionError(13, "Permission denied", "video.mp4"))
+        self.assertEqual(error.error_type, ErrorType.PERMISSION)
+        error = self.error_handler._categorize_error(FileNotFoundError("config missing"))
+        self.assertEqual(error.error_type, ErrorType.FILE)
+        error = self.error_handler._categorize_error(TimeoutError("file read"))
+        self.assertEqual(error.error_type, ErrorType.NETWORK)
+    
+    def test_streamscribe_error_not_recategorized(self):
+        """Test already categorized errors keep their type and message"""
+        received = []
+        self.error_handler.set_general_error_callback(received.append)
+        error = DownloadError("Output file could not be written")
+        result = self.error_handler.handle_error(error, "test_context")
+        self.assertIs(received[0], error)
+        self.assertEqual(result, error.user_message)
+    
+    def test_error_type_callback(self):
+        """Test callbacks fire only for their registered error type"""
+        received = []
+        self.error_handler.set_error_callback(ErrorType.NETWORK, received.append)
+        self.error_handler.handle_error(Exception("DNS lookup failed"), "test_context")
+        self.error_handler.handle_error(Exception("Invalid setting"), "test_context")
+        self.assertEqual([e.error_type for e in received], [ErrorType.NETWORK])
+    
+    def test_safe_thread_execute(self):
+        """Test background execution reports results and errors via callback"""
+        results = []
+        self.error_handler.safe_thread_execute(lambda x: x * 2, lambda *a: results.append(a), 21).result(timeout=5)
+        self.error_handler.safe_thread_execute(lambda: 1 / 0, lambda *a: results.append(a)).result(timeout=5)
+        self.assertEqual(results[0], (42,))
+        self.assertIsNone(results[1][0])
+        self.assertIsInstance(results[1][1], str)
+    
+    def test_safe_thread_execute_does_not_block_exit(self):
+        """Test a long background task does not keep the interpreter alive"""
+        import subprocess
+        code = ("import time\n"
+                "from error_handler import safe_thread_execute\n"
+                "safe_thread_execute(time.sleep, lambda *a: None, 60)\n")
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                       timeout=30, check=True, capture_output=True)
+        self.assertLess(time.monotonic() - start, 30)
+    
+    def test_user_friendly_message_lookup(self):
+        """Test message templates resolve by type and key"""
+        from error_handler import get_user_friendly_message
+        self.assertIn("DNS", get_user_friendly_message(ErrorType.NETWORK, 'dns'))
+        self.assertEqual(get_user_friendly_message(ErrorType.GUI, 'dns'), "Beklenmeyen bir hata oluştu.")
+    
+    def test_guarded_decorator(self):
+        """Test guarded functions return results or the user message"""
+        from error_handler import guarded
+        
+        @guarded("test_context")
+        def divide(a, b):
+            return a / b
+        
+        self.assertEqual(divide(6, 3), 2)
+        self.assertIsInstance(divide(1, 0), str)
+        self.assertEqual(divide.__name__, "divide")
+    
+    def test_duplicate_errors_logged_once(self):
+        """Test repeated identical errors are logged once and summarized on flush"""
+        received = []
+        self.error_handler.set_general_error_callback(received.append)
+        with self.assertLogs('StreamScribe.error_handler', level='ERROR') as logs:
+            for _ in range(5):
+                self.error_handler.handle_error(Exception("Connection refused"), "test_context")
+            self.error_handler.flush_error_log()
+        self.assertEqual(len(received), 5)
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("x4 more occurrences", logs.output[1])
+    
+    def test_duplicate_errors_logged_again_after_interval(self):
+        """Test a suppressed error is logged again, with its repeat count, once the interval passes"""
+        with self.assertLogs('StreamScribe.error_handler', level='ERROR') as logs:
+            for _ in range(3):
+                self.error_handler.handle_error(Exception("Connection refused"), "test_context")
+            # Every earlier occurrence is now older than the interval
+            with patch.object(config, 'ERROR_REPEAT_LOG_INTERVAL', 0.0):
+                self.error_handler.handle_error(Exception("Connection refused"), "test_context")
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn("x2 more occurrences", logs.output[1])
+        self.assertIn("Connection refused", logs.output[2])
+    
+    def test_classification_cached(self):
+        """Test repeated errors reuse the cached classification"""
+        from error_handler import _classify
+        _classify.cache_clear()
+        for _ in range(3):
+            self.error_handler.handle_error(Exception("Connection reset"), "test_context")
+        info = _classify.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
 
 class TestUtils(unittest.TestCase):
     """Test utility functions"""
@@ -99,6 +223,14 @@ class TestUtils(unittest.TestCase):
         result = self.optimizer.get_cached_result("expired_key", max_age=0.05)
         self.assertIsNone(result)
     
+    def test_session_pool_settings(self):
+        """Test named sessions are created once with the requested pool settings"""
+        session = self.optimizer.get_session("test_pool", pool_maxsize=4, max_retries=1)
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter.max_retries.total, 1)
+        self.assertIs(self.optimizer.get_session("test_pool", pool_maxsize=8), session)
+    
     def test_cache_decorator(self):
         """Test cache decorator"""
         call_count = 0
@@ -158,6 +290,39 @@ class TestDownloader(unittest.TestCase):
         self.assertIsNotNone(self.downloader.output_dir)
         self.assertFalse(self.downloader.is_downloading())
     
+    def test_duplicate_download_rejected(self):
+        """Test the same URL cannot be downloaded twice concurrently"""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        errors = []
+        self.downloader.set_error_callback(errors.append)
+        self.downloader._active_urls.add(url)
+
+        self.assertTrue(self.downloader.is_downloading())
+        self.assertFalse(self.downloader.download(url))
+        self.assertEqual(len(errors), 1)
+
+    def test_progress_routed_to_call_callback(self):
+        """Test progress for a URL with its own callback bypasses the shared one"""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        shared, own = [], []
+        self.downloader.set_progress_callback(shared.append)
+        self.downloader._call_callbacks[url] = (own.append, None)
+        tick = {'status': 'downloading', 'downloaded_bytes': 50, 'total_bytes': 100,
+                'filename': 'a.mp4', 'info_dict': {'original_url': url}}
+
+        self.downloader._progress_hook(tick)
+        self.downloader._progress_hook({**tick, 'info_dict': {'original_url': 'other'}})
+        self.assertEqual(len(own), 1)
+        self.assertEqual(len(shared), 1)
+
+    def test_cancel_stops_downloads(self):
+        """Test cancel() aborts running downloads and refuses new ones"""
+        from yt_dlp.utils import DownloadCancelled
+        self.downloader.cancel()
+        with self.assertRaises(DownloadCancelled):
+            self.downloader._progress_hook({'status': 'downloading'})
+        self.assertFalse(self.downloader.download("https://www.youtube.com/watch?v=dQw4w9WgXcQ"))
+
     def test_video_id_extraction(self):
         """Test video ID extraction"""
         test_urls = [
@@ -176,6 +341,96 @@ class TestDownloader(unittest.TestCase):
         playlist_id = self.downloader._extract_playlist_id(test_url)
         self.assertEqual(playlist_id, "PLrAXtmRdnEQy6nuLMOVuY8j4Y2lFcBzwY")
     
+    def test_thumbnail_prediction(self):
+        """Test thumbnail URLs are predicted from the video ID"""
+        from downloader import _thumbnail_urls
+        thumbnails = _thumbnail_urls("dQw4w9WgXcQ")
+        self.assertEqual(thumbnails['thumbnail'], "https://img.youtube.com/vi/dQw4w9WgXcQ/maxresdefault.jpg")
+        self.assertEqual(thumbnails['fallback_thumbnail'], "https://img.youtube.com/vi/dQw4w9WgXcQ/mqdefault.jpg")
+
+    def test_fill_entry_titles(self):
+        """Test missing playlist titles are resolved through the info pool"""
+        entries = [
+            {'id': 'aaaaaaaaaaa', 'title': 'Video 1'},
+            {'id': 'bbbbbbbbbbb', 'title': 'Known'},
+        ]
+        with patch.object(self.downloader, 'get_video_info_fast',
+                          return_value={'title': 'Resolved'}) as mock_info:
+            self.downloader._fill_entry_titles(entries, [0])
+
+        mock_info.assert_called_once_with("https://youtu.be/aaaaaaaaaaa")
+        self.assertEqual(entries[0]['title'], 'Resolved')
+        self.assertEqual(entries[1]['title'], 'Known')
+
+    def test_playlist_html_scraping(self):
+        """Test playlist scraping helpers operate on raw page bytes"""
+        html = (
+            b'<title>My List - YouTube</title>'
+            b'"videoId":"aaaaaaaaaaa" "videoId":"bbbbbbbbbbb" "videoId":"aaaaaaaaaaa"'
+            b' "playlistTitle":"T\xc3\xbcrk\xc3\xa7e Liste"'
+        )
+        self.assertEqual(self.downloader._extract_first_video_id(html), "aaaaaaaaaaa")
+        self.assertEqual(self.downloader._count_playlist_videos_optimized(html), 2)
+        self.assertEqual(self.downloader._extract_playlist_title_optimized(html), "Türkçe Liste")
+
+    def test_ydl_options_template_cached(self):
+        """Test option templates are built once per flag combination"""
+        args = (False, 720, True, True, False, "tr,en", False)
+        first = self.downloader._get_optimized_ydl_options(*args)
+        hits = OptimizedYouTubeDownloader._build_ydl_template.cache_info().hits
+        second = self.downloader._get_optimized_ydl_options(*args)
+        self.assertEqual(OptimizedYouTubeDownloader._build_ydl_template.cache_info().hits, hits + 1)
+        self.assertIsNot(first, second)
+        # Nested values are per call, so in-place changes cannot leak into the cache
+        self.assertIsNot(first['postprocessors'], second['postprocessors'])
+        first['postprocessors'].clear()
+        self.assertTrue(self.downloader._get_optimized_ydl_options(*args)['postprocessors'])
+        self.assertIn("720", first['format'])
+        self.assertEqual(first['progress_hooks'], [self.downloader._progress_hook])
+        self.assertTrue(first['outtmpl'].startswith(self.downloader.output_dir))
+
+    def test_native_downloader_by_default(self):
+        """Test aria2c stays off unless enabled, so live progress keeps working"""
+        self.assertFalse(config.USE_ARIA2C)
+        self.assertIsNone(self.downloader.aria2c_path)
+        args = (False, 720, True, True, False, "tr,en", False)
+        options = self.downloader._get_optimized_ydl_options(*args)
+        self.assertNotIn('external_downloader', options)
+
+    def test_ydl_options_output_dir_override(self):
+        """Test a per-call output directory does not touch the downloader default"""
+        args = (False, 720, True, True, False, "tr,en", False)
+        options = self.downloader._get_optimized_ydl_options(*args, output_dir="/tmp/playlist")
+        self.assertTrue(options['outtmpl'].startswith("/tmp/playlist"))
+        self.assertNotEqual(self.downloader.output_dir, "/tmp/playlist")
+    
+    def test_ydl_instance_reuse(self):
+        """Test YoutubeDL instances are reused for identical options"""
+        opts = {'quiet': True, 'http_headers': {'Accept': '*/*'},
+                'progress_hooks': [self.downloader._progress_hook]}
+        with self.downloader._ydl(opts) as first:
+            pass
+        with self.downloader._ydl(dict(opts)) as second:
+            self.assertIs(first, second)
+            # A concurrent request for the same options gets its own instance
+            with self.downloader._ydl(dict(opts)) as third:
+                self.assertIsNot(second, third)
+        # Both stay warm for the next concurrent callers
+        self.assertEqual(len(self.downloader._ydl_instances[_freeze_options(opts)]), 2)
+        self.downloader.cleanup()
+
+    def test_ydl_instance_cache_bounded(self):
+        """Test YoutubeDL instances for old option signatures are evicted and closed"""
+        with patch.object(config, 'YDL_CACHE_SIZE', 1):
+            with self.downloader._ydl({'quiet': True, 'outtmpl': '/tmp/a/%(id)s'}) as first:
+                pass
+            with patch.object(first, 'close') as close:
+                with self.downloader._ydl({'quiet': True, 'outtmpl': '/tmp/b/%(id)s'}):
+                    pass
+                close.assert_called_once()
+            self.assertEqual(len(self.downloader._ydl_instances), 1)
+        self.downloader.cleanup()
+
     def test_title_cleaning(self):
         """Test title cleaning functionality"""
         test_titles = [
@@ -190,6 +445,12 @@ class TestDownloader(unittest.TestCase):
             self.assertIsInstance(cleaned, str)
             self.assertGreater(len(cleaned), 0)
     
+    def test_title_cleaning_fast_path(self):
+        """Test plain ASCII titles skip decoding but still normalize whitespace"""
+        self.assertEqual(self.downloader._clean_title("  Plain   ASCII title "), "Plain ASCII title")
+        self.assertEqual(self.downloader._clean_title("Tom &amp; Jerry"), "Tom & Jerry")
+        self.assertEqual(self.downloader._clean_title("   "), "Bilinmeyen Video")
+    
     def test_format_string_building(self):
         """Test format string building"""
         # Test video format
@@ -224,6 +485,42 @@ class TestDownloader(unittest.TestCase):
         self.assertFalse(info.get('is_playlist', False))
 
 
+class TestURLValidation(unittest.TestCase):
+    """Test the GUI's URL entry check"""
+    
+    def setUp(self):
+        # Imported here so the other tests do not load the GUI toolkit
+        from gui import _URL_RE
+        self.url_re = _URL_RE
+    
+    def test_accepts_youtube_urls(self):
+        """Test any youtube.com subdomain/path and youtu.be links are accepted, case-insensitively"""
+        for url in (
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "HTTPS://WWW.YOUTUBE.COM/WATCH?V=dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://music.youtube.com/playlist?list=PL123",
+            "https://www.youtube.com/@channel",
+            "youtube.com/shorts/abc123",
+            "https://youtu.be/dQw4w9WgXcQ?t=10",
+        ):
+            with self.subTest(url=url):
+                self.assertTrue(self.url_re.match(url))
+    
+    def test_rejects_other_urls(self):
+        """Test other hosts and bare domains are rejected"""
+        for url in (
+            "",
+            "https://example.com/watch?v=dQw4w9WgXcQ",
+            "https://youtube.com.evil.com/watch?v=x",
+            "https://notyoutube.com/watch?v=x",
+            "https://www.youtube.com",
+            "random text youtube.com/watch",
+        ):
+            with self.subTest(url=url):
+                self.assertFalse(self.url_re.match(url))
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     
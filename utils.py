@@ -6,13 +6,16 @@ Performance optimizations and utility functions
 """
 
 import os
+import queue
 import time
 import hashlib
 import threading
-from typing import Dict, Any, Optional, Callable, List
+from concurrent.futures import Executor, Future
+from typing import Dict, Any, Optional, Callable, List, Union
 from pathlib import Path
 from functools import wraps, lru_cache
 import requests
+from urllib3.util.retry import Retry
 from PIL import Image
 from io import BytesIO
 
@@ -56,16 +59,20 @@ class PerformanceOptimizer:
                 del self._cache[oldest_key]
                 del self._cache_timestamps[oldest_key]
     
-    def get_session(self, name: str = "default") -> requests.Session:
-        """Get or create a requests session with connection pooling"""
+    def get_session(self, name: str = "default", pool_connections: int = 10,
+                    pool_maxsize: int = 20, max_retries: Union[int, Retry] = 3) -> requests.Session:
+        """Get or create a requests session with connection pooling
+        
+        The pool settings only apply when the named session is first created.
+        """
         if name not in self._session_pool:
             session = requests.Session()
             session.headers.update(config.REQUEST_HEADERS)
             # Configure connection pooling
             adapter = requests.adapters.HTTPAdapter(
-                pool_connections=10,
-                pool_maxsize=20,
-                max_retries=3
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries
             )
             session.mount('http://', adapter)
             session.mount('https://', adapter)
@@ -276,6 +283,80 @@ class ThreadManager:
 thread_manager = ThreadManager()
 
 
+class DaemonThreadPoolExecutor(Executor):
+    """Bounded thread pool whose workers are daemon threads
+    
+    concurrent.futures joins ThreadPoolExecutor workers at interpreter exit, so one
+    blocking task keeps a closed app alive; these workers end with the process.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker"):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+    
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) and return its Future"""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self._work_queue.put((future, fn, args, kwargs))
+            
+            # Start another worker only when none is idle, as ThreadPoolExecutor does
+            if not self._idle.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+    
+    def _worker(self):
+        """Run queued work items until the None sentinel arrives"""
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            del item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del future
+            self._idle.release()
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop accepting work, optionally cancelling queued items, and stop the workers"""
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._work_queue.put(None)
+            threads = list(self._threads)
+        
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
 class URLValidator:
     """URL validation utilities"""
     